@@ -1,18 +1,9 @@
-from functools import lru_cache
+from functools import cache
 
-from pyback.config.settings import Settings
-
-
-@lru_cache
-def get_settings() -> Settings:
-    """Load and cache the Settings instance.
-
-    Returns:
-        Settings: Cached Settings instance
-    """
-    return Settings()
+from pyback.config.settings import get_settings
 
 
+@cache
 def get_auth_settings():
     """Retrieve authentication-specific settings.
 
@@ -22,6 +13,7 @@ def get_auth_settings():
     return get_settings().auth
 
 
+@cache
 def get_postgres_settings():
     """Retrieve PostgreSQL database settings.
 
@@ -32,6 +24,7 @@ def get_postgres_settings():
     return get_settings().db.postgres
 
 
+@cache
 def get_redis_settings():
     """Retrieve Redis database settings.
 
@@ -1,37 +1,67 @@
+import asyncio
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
+from fastapi import Request
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 
 if TYPE_CHECKING:
     from pyback.db.postgres import PostgresDatabase
     from pyback.db.redis import RedisDatabase
 
-from pyback.db.postgres import pgdb
-from pyback.db.redis import redis_db
+
+AFTER_COMMIT_TASKS = "after_commit_tasks"
+"""Key of ``AsyncSession.info`` holding the tasks started by commit hooks."""
 
 
-def get_db() -> "PostgresDatabase":
+async def get_db(request: Request) -> "PostgresDatabase":
     """Retrieve the PostgreSQL database connection.
 
-    Raises:
-        RuntimeError: If the PostgreSQL session manager is not initialized.
+    The instance and its connection pool are attached to the application state
+    once at startup, see ``lifespan``.
+
+    Args:
+        request (Request): The incoming request.
 
     Returns:
         PostgresDatabase: An initialized PostgreSQL database connection.
     """
-    if pgdb is None:
-        raise RuntimeError("PostgreSQL session manager instance not initialized")
-    return pgdb
+    return request.app.state.pgdb
 
 
-def get_redis_db() -> "RedisDatabase":
+async def get_redis_db(request: Request) -> "RedisDatabase":
     """Retrieve the Redis database connection.
 
-    Raises:
-        RuntimeError: If the Redis client manager is not initialized.
+    The instance is attached to the application state once at startup, see
+    ``lifespan``.
+
+    Args:
+        request (Request): The incoming request.
 
     Returns:
         RedisDatabase: An initialized Redis database connection.
     """
-    if redis_db is None:
-        raise RuntimeError("Redis client manager instance not initialized")
-    return redis_db
+    return request.app.state.redis_db
+
+
+async def get_db_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Provide one PostgreSQL session and transaction for the whole request.
+
+    The transaction is committed once the endpoint returns, before the response
+    is sent, and rolled back if it raises. A connection is only checked out
+    from the pool when the session first runs a query. Tasks that commit hooks
+    register under ``AFTER_COMMIT_TASKS``, such as cache invalidations, are
+    awaited before the response too, so the client's next request sees them.
+
+    Args:
+        request (Request): The incoming request.
+
+    Yields:
+        AsyncSession: A session inside an open transaction.
+    """
+    async with request.app.state.pgdb.session() as session:
+        async with session.begin():
+            yield session
+        if tasks := session.info.pop(AFTER_COMMIT_TASKS, None):
+            await asyncio.gather(*tasks)
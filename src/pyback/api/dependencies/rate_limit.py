@@ -21,6 +21,10 @@ def rate_limit(
         prefix: Optional override for Redis key prefix
         key_func: Optional custom key generation function
 
+    Identical configurations share a single limiter instance, cached by
+    ``RateLimitConfig.get_rate_limiter``, so declaring the same limit on several
+    routes does not build a new RateLimiter each time.
+
     Returns:
         A dependency that can be used at the router or endpoint level
     """
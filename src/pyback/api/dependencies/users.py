@@ -1,14 +1,28 @@
-from typing import Annotated
+from fastapi import Depends, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from fastapi import Depends
-
-from pyback.db.postgres import PostgresDatabase
 from pyback.db.repositories.users import UserRepository
 from pyback.services.users import UserService
 
-from .db import get_db
+from .db import get_db_session
+
+
+async def get_user_service(
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
+) -> UserService:
+    """Inject a UserService bound to the request's database session.
+
+    All database calls the endpoint makes through the service then share one
+    connection and transaction, committed at the end of the request.
+    """
+    return UserService(UserRepository(request.app.state.pgdb, session))
+
 
+async def get_streaming_user_service(request: Request) -> UserService:
+    """Inject a UserService that is not bound to a request session.
 
-async def get_user_service(db: Annotated[PostgresDatabase, Depends(get_db)]):
-    """Inject UserService with UserRepository."""
-    return UserService(UserRepository(db))
+    For endpoints that only stream records, the stream opens a session of its
+    own, so a request transaction would be opened and never used.
+    """
+    return UserService(UserRepository(request.app.state.pgdb))
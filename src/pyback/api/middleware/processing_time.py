@@ -1,29 +1,40 @@
 import time
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class ProcessingTimeMiddleware(BaseHTTPMiddleware):
-    """Middleware to measure and add processing time to response headers."""
+class ProcessingTimeMiddleware:
+    """Middleware to measure and add processing time to response headers.
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    Implemented as a plain ASGI middleware rather than on top of
+    ``BaseHTTPMiddleware``, which wraps every request in an extra task group
+    and memory stream and buffers streaming responses.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and add processing time to response headers.
 
         Args:
-            request (Request): The incoming request.
-            call_next (RequestResponseEndpoint): The next request handler in
-            the middleware chain.
-
-        Returns:
-            Response: The response with added X-Process-Time header.
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
         """
-        start_time = time.perf_counter()
-        response = await call_next(request)
-        process_time = time.perf_counter() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter_ns()
+
+        async def send_with_process_time(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time_ns = time.perf_counter_ns() - start_time
+                headers = MutableHeaders(scope=message)
+                # Still reported in seconds, rounded to the microsecond
+                headers.append("X-Process-Time", f"{process_time_ns / 1e9:.6f}")
+            await send(message)
+
+        await self.app(scope, receive, send_with_process_time)
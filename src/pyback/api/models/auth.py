@@ -1,17 +1,44 @@
-from pydantic import BaseModel, EmailStr
+import re
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class LoginRequest(BaseModel):
     """Model representing the login request payload.
 
+    The email only gets a cheap syntax check here, the lookup against the
+    stored users is what actually validates it. Full ``EmailStr`` validation
+    is kept for signup, see ``UserCreate``.
+
     Attributes:
-        email (EmailStr): The email address of the user attempting to log in.
+        email (str): The email address of the user attempting to log in.
         password (str): The user's password for authentication.
     """
 
-    email: EmailStr
+    email: str = Field(max_length=255)
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Validate the email syntax and normalize it.
+
+        Args:
+            v (str): The email address to validate.
+
+        Raises:
+            ValueError: If the input does not look like an email address.
+
+        Returns:
+            str: The lowercased email, the canonical form users are stored in.
+        """
+        if not _EMAIL_RE.match(v):
+            raise ValueError("value is not a valid email address")
+        return v.lower()
+
 
 class Token(BaseModel):
     """Model representing an authentication token.
@@ -24,6 +51,8 @@ class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"  # noqa: S105
 
+    model_config = ConfigDict(frozen=True)
+
 
 class TokenData(BaseModel):
     """Model representing decoded token data.
@@ -31,6 +60,11 @@ class TokenData(BaseModel):
     Attributes:
         email (EmailStr | None, optional): The email associated with the token,
         can be None if no email is present.
+        exp (int | None, optional): The token expiry as a Unix timestamp,
+        can be None if the token does not expire.
     """
 
     email: EmailStr | None = None
+    exp: int | None = None
+
+    model_config = ConfigDict(frozen=True)
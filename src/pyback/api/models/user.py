@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
@@ -13,37 +13,37 @@ class UserBase(BaseModel):
 
     email: EmailStr = Field(max_length=255)
 
+    @field_validator("email", mode="after")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Lowercase the email so it is stored and looked up in one canonical form.
+
+        Args:
+            v (str): The validated email address.
+
+        Returns:
+            str: The lowercased email address.
+        """
+        return v.lower()
+
 
 class UserCreate(UserBase):
     """Model for creating a new user.
 
     Attributes:
-        password (str): User's password, between 8 and 30 characters long.
-        first_name (str): User's first name, between 2 and 100 characters long.
-        last_name (str): User's last name, between 2 and 100 characters long.
+        password (str): User's password, between 8 and 30 characters long and
+            not only whitespace.
+        first_name (str): User's first name, between 2 and 100 characters long
+            and not only whitespace.
+        last_name (str): User's last name, between 2 and 100 characters long
+            and not only whitespace.
     """
 
-    password: str = Field(min_length=8, max_length=30)
-    first_name: str = Field(min_length=2, max_length=100)
-    last_name: str = Field(min_length=2, max_length=100)
-
-    @field_validator("password", "first_name", "last_name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Validate that the input is not an empty string or whitespace.
-
-        Args:
-            v (str): The input string to validate.
-
-        Raises:
-            ValueError: If the input is an empty string or contains only whitespace.
-
-        Returns:
-            str: The validated input string.
-        """
-        if v.strip() == "":
-            raise ValueError("Name cannot be empty or contain only whitespace")
-        return v
+    # The pattern requires at least one non-whitespace character, checked by
+    # pydantic-core without a Python-level validator
+    password: str = Field(min_length=8, max_length=30, pattern=r"\S")
+    first_name: str = Field(min_length=2, max_length=100, pattern=r"\S")
+    last_name: str = Field(min_length=2, max_length=100, pattern=r"\S")
 
 
 class UserUpdate(BaseModel):
@@ -74,9 +74,9 @@ class User(UserBase):
     id: UUID = Field(default_factory=uuid4)
     first_name: str
     last_name: str
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = Field(default_factory=lambda data: data["created_at"])
     is_admin: bool = False
     is_active: bool = True
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
 from pyback.api.dependencies.auth import get_auth_service
 from pyback.api.dependencies.common import get_auth_settings
@@ -55,7 +56,9 @@ async def login_for_access_token(
     user = await auth_service.authenticate(login_data.email, login_data.password)
     if not user:
         raise InvalidCredentialsError("Incorrect email or password")
-    return await auth_service.get_access_token(user, auth_settings)
+    access_token = await auth_service.get_access_token(user, auth_settings)
+    # Encoded as is, no Token model is built or validated for the response
+    return ORJSONResponse({"access_token": access_token, "token_type": "bearer"})
 
 
 @router.post(
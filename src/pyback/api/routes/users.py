@@ -1,10 +1,15 @@
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from pyback.api.dependencies.auth import admin_required, get_current_user
 from pyback.api.dependencies.rate_limit import rate_limit
-from pyback.api.dependencies.users import get_user_service
+from pyback.api.dependencies.users import get_streaming_user_service, get_user_service
 from pyback.api.models.user import User, UserCreate, UserUpdate
 from pyback.config.rate_limit import RateLimitConfig
 from pyback.core.exceptions import ConflictError, NotFoundError
@@ -18,13 +23,38 @@ router = APIRouter(
     ],
 )
 
+_user_adapter = TypeAdapter(User)
+
+
+async def _encode_users(users: AsyncGenerator[Any, None]) -> AsyncIterator[bytes]:
+    """Encode users one at a time into the chunks of a JSON array.
+
+    StreamingResponse does not close the iterator when the client disconnects,
+    so the users stream is closed here to release its cursor and connection
+    as soon as streaming stops.
+    """
+    separator = b"["
+    async with aclosing(users):
+        async for user in users:
+            validated = _user_adapter.validate_python(user, from_attributes=True)
+            yield separator + _user_adapter.dump_json(validated)
+            separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
 
 @router.get("/", response_model=list[User], dependencies=[Depends(admin_required)])
 async def get_active_users(
-    users_service: UserService = Depends(get_user_service),
-):
-    """Retrieve all active users."""
-    return await users_service.list_active_users()
+    users_service: UserService = Depends(get_streaming_user_service),
+) -> StreamingResponse:
+    """Retrieve all active users.
+
+    Users are streamed from the database and each one is encoded straight to
+    JSON bytes by pydantic-core, so the full list is never held in memory.
+    """
+    return StreamingResponse(
+        _encode_users(users_service.list_active_users()),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -2,13 +2,13 @@ from datetime import datetime
 import json
 from pathlib import Path
 import sys
-import tomllib
+from tomllib import TOMLDecodeError
 from typing import Any, TypedDict
 
 from loguru import logger
 from pydantic import ValidationError
 
-from pyback.api.dependencies.common import get_settings
+from pyback.config.settings import get_settings, load_toml
 
 from .log_models import LoggingConfig
 
@@ -70,10 +70,8 @@ def load_log_config(config_path: Path) -> LoggingConfig | None:
         )
         return None
     try:
-        with config_path.open(mode="rb") as f:
-            data = tomllib.load(f)
-        config = data.get("logging", {})
-    except tomllib.TOMLDecodeError as e:
+        config = load_toml(config_path).get("logging", {})
+    except TOMLDecodeError as e:
         logger.error(f"Error decoding TOML config file: {e}")
         return None
     except Exception as e:
@@ -1,19 +1,92 @@
-from collections.abc import Callable
-from contextlib import contextmanager
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from enum import Enum
-from ipaddress import ip_address, ip_network
-import time
+from functools import lru_cache, partial
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 from typing import Any
 
 from fastapi import Request
+from fastapi_limiter import FastAPILimiter
 from fastapi_limiter.depends import RateLimiter
 from loguru import logger
+from redis.exceptions import NoScriptError
 
 from pyback.core.exceptions import BadRequestError
 
 
-@dataclass
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+if count < limit then
+    redis.call('ZADD', key, now, t[1] .. t[2] .. '-' .. count)
+    redis.call('PEXPIRE', key, window)
+    return 0
+end
+
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return math.max(tonumber(oldest[2]) + window - now, 1)
+"""
+"""Lua script enforcing a sliding-window limit in a single round trip.
+
+Drops entries older than the window, counts the remaining ones and records
+the current request if it fits. Returns 0 when the request is allowed, or the
+milliseconds until the oldest entry leaves the window otherwise.
+"""
+
+
+class SlidingWindowRateLimiter(RateLimiter):
+    """RateLimiter counting requests over a sliding window instead of a fixed one.
+
+    The whole check runs server-side through ``SLIDING_WINDOW_SCRIPT``, invoked
+    by SHA so each rate-limited request costs one Redis round trip.
+    """
+
+    lua_sha: str | None = None
+
+    @classmethod
+    async def load_script(cls, redis: Any) -> None:
+        """Load the sliding-window script into Redis and cache its SHA."""
+        cls.lua_sha = await redis.script_load(SLIDING_WINDOW_SCRIPT)
+
+    async def _check(self, key: str) -> int:
+        redis = FastAPILimiter.redis
+        if SlidingWindowRateLimiter.lua_sha is None:
+            await self.load_script(redis)
+        try:
+            return await redis.evalsha(
+                SlidingWindowRateLimiter.lua_sha,
+                1,
+                key,
+                str(self.times),
+                str(self.milliseconds),
+            )
+        except NoScriptError:
+            # Script cache was flushed on the server, load it again
+            await self.load_script(redis)
+            return await redis.evalsha(
+                SlidingWindowRateLimiter.lua_sha,
+                1,
+                key,
+                str(self.times),
+                str(self.milliseconds),
+            )
+
+
+@dataclass(slots=True, frozen=True)
 class RateLimitRule:
     """Rate limit rule configuration."""
 
@@ -22,6 +95,34 @@ class RateLimitRule:
     prefix: str
 
 
+AddressRanges = dict[int, tuple[tuple[int, ...], tuple[int, ...]]]
+"""Sorted range start and end addresses, as integers, keyed by IP version."""
+
+
+def _build_ranges(networks: Iterable[IPv4Network | IPv6Network]) -> AddressRanges:
+    """Merge networks into sorted, non-overlapping address ranges.
+
+    Args:
+        networks: The networks to merge.
+
+    Returns:
+        For each IP version, the sorted range start addresses and the matching
+        end addresses, as integers.
+    """
+    ranges: dict[int, list[tuple[int, int]]] = {}
+    for net in sorted(networks, key=lambda n: (n.version, int(n.network_address))):
+        start, end = int(net.network_address), int(net.broadcast_address)
+        merged = ranges.setdefault(net.version, [])
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return {
+        version: (tuple(r[0] for r in merged), tuple(r[1] for r in merged))
+        for version, merged in ranges.items()
+    }
+
+
 class RateLimitConfig:
     """Enhanced rate limiting configuration with security features."""
 
@@ -35,7 +136,6 @@ class RateLimitConfig:
 
     # Security configuration
     MAX_HEADER_LENGTH = 1024  # Maximum length for header values
-    VALIDATION_TIMEOUT = 1.0  # Seconds for IP validation timeout
     MAX_FORWARDED_IPS = 10  # Maximum number of IPs in X-Forwarded-For
 
     # Trusted proxy networks (private network ranges)
@@ -47,65 +147,70 @@ class RateLimitConfig:
             ip_network("127.0.0.0/8"),  # Localhost
         ],
     )
-
-    # Rate limit configurations for different scopes
-    DEFAULT_LIMITS: dict[Scope, RateLimitRule] = {
-        Scope.PUBLIC: RateLimitRule(times=10, seconds=60, prefix="public"),
-        Scope.AUTHENTICATED: RateLimitRule(times=100, seconds=60, prefix="auth"),
-        Scope.ADMIN: RateLimitRule(times=1000, seconds=60, prefix="admin"),
-        Scope.API: RateLimitRule(times=200, seconds=60, prefix="api"),
+    # Same networks as sorted (starts, ends) address ranges per IP version
+    _TRUSTED_RANGES: AddressRanges = _build_ranges(TRUSTED_PROXIES)
+
+    # Rate limit configurations for different scopes, keyed on the scope values
+    # as plain strings hash without going through Enum.__hash__
+    DEFAULT_LIMITS: dict[str, RateLimitRule] = {
+        Scope.PUBLIC.value: RateLimitRule(times=10, seconds=60, prefix="public"),
+        Scope.AUTHENTICATED.value: RateLimitRule(times=100, seconds=60, prefix="auth"),
+        Scope.ADMIN.value: RateLimitRule(times=1000, seconds=60, prefix="admin"),
+        Scope.API.value: RateLimitRule(times=200, seconds=60, prefix="api"),
     }
 
-    @classmethod
-    @contextmanager
-    def timeout(cls, seconds: float):
-        """Context manager for timeout operations."""
-        deadline = time.time() + seconds
-        yield
-        if time.time() > deadline:
-            raise TimeoutError
-
     @classmethod
     def sanitize_header_value(cls, value: str | None) -> str:
         """Sanitize and truncate header values."""
         if not value:
             return ""
-        return str(value)[: cls.MAX_HEADER_LENGTH].strip()
+        # Header values from Starlette are already str, and usually short and
+        # trimmed, in which case they are returned without any copy
+        if len(value) > cls.MAX_HEADER_LENGTH:
+            value = value[: cls.MAX_HEADER_LENGTH]
+        if value[0].isspace() or value[-1].isspace():
+            value = value.strip()
+        return value
 
     @classmethod
     def is_trusted_proxy(cls, ip: str) -> bool:
-        """Check if an IP belongs to trusted proxy networks with timeout protection."""
-        try:
-            with cls.timeout(cls.VALIDATION_TIMEOUT):
-                addr = ip_address(ip)
-                return any(addr in network for network in cls.TRUSTED_PROXIES)
-        except (ValueError, TimeoutError) as e:
-            logger.warning(f"IP validation failed for {ip}: {str(e)}")
-            return False
+        """Check if an IP belongs to trusted proxy networks."""
+        valid, trusted = _check_ip(ip)
+        if not valid:
+            logger.warning(f"IP validation failed for {ip}")
+        return trusted
 
     @classmethod
     def get_real_client_ip(cls, request: Request) -> str:
-        """Get the real client IP with enhanced security and validation."""
+        """Get the real client IP with enhanced security and validation.
+
+        Each candidate IP is parsed at most once, validity and trust are both
+        answered by the same cached lookup.
+        """
         immediate_client_ip = request.client.host
 
         # Always validate immediate client IP
-        if not cls.is_valid_ip(immediate_client_ip):
+        immediate_valid, immediate_trusted = _check_ip(immediate_client_ip)
+        if not immediate_valid:
             logger.warning(f"Invalid immediate client IP: {immediate_client_ip}")
             raise BadRequestError("Invalid client IP")
 
-        forwarded_for = cls.sanitize_header_value(
-            request.headers.get("x-forwarded-for"),
-        )
-
+        forwarded_for = request.headers.get("x-forwarded-for")
         if forwarded_for:
-            ips = [ip.strip() for ip in forwarded_for.split(",")][
-                : cls.MAX_FORWARDED_IPS
+            forwarded_for = cls.sanitize_header_value(forwarded_for)
+            # Split off at most MAX_FORWARDED_IPS entries and drop the remainder,
+            # so the work does not grow with the number of commas in the header
+            ips = [
+                ip.strip()
+                for ip in forwarded_for.split(",", cls.MAX_FORWARDED_IPS)[
+                    : cls.MAX_FORWARDED_IPS
+                ]
             ]
 
             # Validate the entire proxy chain
             if len(ips) > 1:
                 # Check if the connecting IP is a trusted proxy
-                if not cls.is_trusted_proxy(immediate_client_ip):
+                if not immediate_trusted:
                     logger.warning(
                         f"Untrusted proxy attempt from {immediate_client_ip}",
                     )
@@ -114,22 +219,22 @@ class RateLimitConfig:
                 # Verify the chain of trust
                 # (all but the first IP should be trusted proxies)
                 for proxy_ip in ips[1:]:
-                    if not cls.is_trusted_proxy(proxy_ip):
+                    if not _check_ip(proxy_ip)[1]:
                         logger.warning(f"Broken proxy chain at IP: {proxy_ip}")
                         return immediate_client_ip
 
                 # Use the first IP if it's valid
-                if cls.is_valid_ip(ips[0]):
+                if _check_ip(ips[0])[0]:
                     return ips[0]
 
             elif len(ips) == 1:
                 # If there's exactly one IP in X-Forwarded-For, use it if it's valid.
-                if cls.is_valid_ip(ips[0]):
+                if _check_ip(ips[0])[0]:
                     return ips[0]
 
         # Fallback to X-Real-IP with validation
         real_ip = cls.sanitize_header_value(request.headers.get("x-real-ip"))
-        if real_ip and cls.is_valid_ip(real_ip):
+        if real_ip and _check_ip(real_ip)[0]:
             return real_ip
 
         return immediate_client_ip
@@ -137,11 +242,7 @@ class RateLimitConfig:
     @staticmethod
     def is_valid_ip(ip: str) -> bool:
         """Validate IP address format."""
-        try:
-            ip_address(ip)
-            return True
-        except ValueError:
-            return False
+        return _check_ip(ip)[0]
 
     @classmethod
     def get_user_identifier(cls, request: Request) -> str | None:
@@ -158,27 +259,39 @@ class RateLimitConfig:
         return api_key if api_key else None
 
     @classmethod
-    async def generate_key(cls, request: Request, prefix: str) -> str:
-        """Generate a comprehensive rate limit key with multiple identifiers."""
-        components = [prefix]
-
-        # Add all available identifiers
-        identifiers = {
-            "user": cls.get_user_identifier(request),
-            "api": cls.get_api_key(request),
-            "ip": cls.get_real_client_ip(request),
-            "path": request.url.path,
-            "method": request.method,
-        }
-
-        # Add non-None identifiers to the key
-        components.extend(
-            f"{key}:{value}" for key, value in identifiers.items() if value is not None
+    def generate_key(cls, request: Request, prefix: str) -> str:
+        """Generate a comprehensive rate limit key with multiple identifiers.
+
+        The client identity (user, API key and IP) is wrapped in a Redis Cluster
+        hash tag, e.g. ``public:{ip:1.2.3.4}:path:/x:method:GET``, so every
+        limiter key of one client maps to the same slot.
+        """
+        # Identify who is calling, skipping identifiers that are not available.
+        # All parts are already strings, so plain concatenation is used rather
+        # than f-strings to avoid going through the formatting machinery.
+        identity = []
+        user = cls.get_user_identifier(request)
+        if user is not None:
+            identity.append("user:" + user)
+        api_key = cls.get_api_key(request)
+        if api_key is not None:
+            identity.append("api:" + api_key)
+        identity.append("ip:" + cls.get_real_client_ip(request))
+
+        # Then what is being called. The path is read from the ASGI scope, as
+        # request.url would build and parse a full URL just to return it.
+        return (
+            prefix
+            + ":{"
+            + ":".join(identity)
+            + "}:path:"
+            + request.scope["path"]
+            + ":method:"
+            + request.method
         )
 
-        return ":".join(components)
-
     @classmethod
+    @lru_cache(maxsize=128)
     def get_rate_limiter(
         cls,
         scope: Scope,
@@ -186,11 +299,14 @@ class RateLimitConfig:
         seconds: int | None = None,
         prefix: str | None = None,
         key_func: Callable[[Request], Any] | None = None,
-    ) -> RateLimiter:
-        """Get a configured rate limiter with validation."""
-        try:
-            config = cls.DEFAULT_LIMITS[scope]
-        except KeyError:
+    ) -> SlidingWindowRateLimiter:
+        """Get a configured rate limiter with validation.
+
+        Limiters are cached per configuration, so identical limits declared on
+        several routes share one instance.
+        """
+        config = cls.DEFAULT_LIMITS.get(scope.value)
+        if config is None:
             logger.error(f"Invalid rate limit scope: {scope}")
             raise ValueError(f"Invalid rate limit scope: {scope}")
 
@@ -201,11 +317,49 @@ class RateLimitConfig:
             prefix=prefix or config.prefix,
         )
 
-        async def async_key_generator(req: Request) -> str:
-            return await cls.generate_key(req, rule.prefix)
-
-        return RateLimiter(
+        return SlidingWindowRateLimiter(
             times=rule.times,
             seconds=rule.seconds,
-            identifier=key_func or async_key_generator,
+            identifier=key_func or partial(_default_key_generator, prefix=rule.prefix),
         )
+
+
+async def _default_key_generator(req: Request, prefix: str) -> str:
+    """Default limiter identifier, bound to a key prefix with ``partial``."""
+    # RateLimiter awaits its identifier, the key itself is built sync
+    return RateLimitConfig.generate_key(req, prefix)
+
+
+def _is_trusted_int(value: int, version: int) -> bool:
+    """Check a parsed IP against the trusted proxy ranges with a binary search."""
+    ranges = RateLimitConfig._TRUSTED_RANGES.get(version)
+    if ranges is None:
+        return False
+    starts, ends = ranges
+    i = bisect_right(starts, value) - 1
+    return i >= 0 and value <= ends[i]
+
+
+def _parse_ip(ip: str) -> IPv4Address | IPv6Address | None:
+    """Parse an IP address, returning ``None`` if it is not valid."""
+    try:
+        return ip_address(ip)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _check_ip(ip: str) -> tuple[bool, bool]:
+    """Parse an IP once and tell whether it is valid and a trusted proxy.
+
+    Results are cached, so proxies and clients seen repeatedly skip parsing.
+    The cache is bounded since the input comes from client-supplied headers.
+
+    Returns:
+        tuple[bool, bool]: Whether ``ip`` is a valid IP address, and whether it
+            belongs to the trusted proxy networks.
+    """
+    addr = _parse_ip(ip)
+    if addr is None:
+        return False, False
+    return True, _is_trusted_int(int(addr), addr.version)
@@ -1,11 +1,21 @@
 from collections.abc import Callable
+from functools import cache
+import os
 from pathlib import Path
 import tomllib
 from tomllib import TOMLDecodeError
 from typing import Any, Final, Literal
 
 from loguru import logger
-from pydantic import BaseModel, Field, PostgresDsn, RedisDsn, SecretStr, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PostgresDsn,
+    RedisDsn,
+    SecretStr,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -22,6 +32,35 @@ TomlLoader = Callable[[], dict[str, Any]]
 ServerLogLevel = Literal["debug", "info", "warning", "error", "critical"]
 """Type definition for valid server log levels."""
 
+PoolMode = Literal["sqlalchemy", "nullpool"]
+"""Type definition for the connection pooling modes of PostgreSQL."""
+
+_toml_cache: dict[Path, tuple[int, SettingsDict]] = {}
+"""Parsed TOML files with the modification time they were parsed at."""
+
+
+def load_toml(path: Path) -> SettingsDict:
+    """Load a TOML file, reusing the parsed content until the file changes.
+
+    Args:
+        path (Path): Path to the TOML file.
+
+    Returns:
+        SettingsDict: The parsed TOML content. Callers must not mutate it.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        TOMLDecodeError: If the file is not valid TOML.
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _toml_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with path.open(mode="rb") as f:
+        config = tomllib.load(f)
+    _toml_cache[path] = (mtime_ns, config)
+    return config
+
 
 class AuthSettings(BaseModel):
     """Settings for authentication configuration.
@@ -31,6 +70,7 @@ class AuthSettings(BaseModel):
         JWT_ALGORITHM: Algorithm used for JWT token encryption, defaults to "HS256".
         JWT_SESSION_TTL_MIN: Session time-to-live in minutes, must be greater than 0.
         JWT_EXPIRE_MINUTES: Optional JWT token expiration time in minutes.
+        BCRYPT_ROUNDS: Log2 cost factor for new bcrypt password hashes, defaults to 12.
     """
 
     JWT_SECRET: SecretStr | None = None
@@ -41,6 +81,12 @@ class AuthSettings(BaseModel):
         gt=0,
     )
     JWT_EXPIRE_MINUTES: int | None = None
+    BCRYPT_ROUNDS: int = Field(
+        default=12,
+        description="Log2 cost factor for new bcrypt password hashes",
+        ge=4,
+        le=31,
+    )
 
 
 class AppSettings(BaseModel):
@@ -51,12 +97,17 @@ class AppSettings(BaseModel):
         SERVER_PORT: Port number for the server, defaults to 8000.
         SERVER_LOG_LEVEL: Logging level for the server, defaults to "info".
         SERVER_RELOAD: Flag to enable auto-reload for development, defaults to False.
+        SERVER_WORKERS: Number of worker processes when reload is disabled,
+            defaults to the number of CPUs. Each worker caches authenticated
+            users in its own memory, user changes reach the other workers
+            through the versions kept in Redis.
     """
 
     SERVER_HOST: str = "app"
     SERVER_PORT: int = 8000
     SERVER_LOG_LEVEL: str = "info"
     SERVER_RELOAD: bool = False
+    SERVER_WORKERS: int = Field(default_factory=lambda: os.cpu_count() or 1, ge=1)
 
     @field_validator("SERVER_LOG_LEVEL", mode="before")
     @classmethod
@@ -88,6 +139,15 @@ class PostgresSettings(BaseModel):
         PGUSER: Database user name, defaults to "postgres".
         PGPASSWORD: Database password.
         DEBUG: Enable debug mode for database operations.
+        POOL_MODE: "sqlalchemy" for an in-app connection pool, or "nullpool" when
+            an external pooler such as pgbouncer is used, defaults to "sqlalchemy".
+        POOL_SIZE: Number of pooled connections, defaults to 50.
+        MAX_OVERFLOW: Connections allowed beyond POOL_SIZE, -1 for no limit,
+            defaults to 10.
+        STMT_CACHE_SIZE: Prepared statements cached per connection, must be 0
+            behind pgbouncer in transaction pooling mode, defaults to 512.
+        POSTGRES_SCHEMA: Schema searched for tables before "public", defaults to
+            None, which keeps the server's search_path.
     """
 
     POSTGRES_HOST: str = "db"
@@ -96,6 +156,11 @@ class PostgresSettings(BaseModel):
     PGUSER: str = "postgres"
     PGPASSWORD: SecretStr | None = None
     DEBUG: bool = False
+    POOL_MODE: PoolMode = "sqlalchemy"
+    POOL_SIZE: int = Field(default=50, ge=1)
+    MAX_OVERFLOW: int = Field(default=10, ge=-1)
+    STMT_CACHE_SIZE: int = Field(default=512, ge=0)
+    POSTGRES_SCHEMA: str | None = None
 
     @property
     def postgres_dsn(self) -> PostgresDsn:
@@ -194,24 +259,21 @@ class Settings(BaseSettings):
         description="Database configuration",
     )
 
-    def model_post_init(self, _context) -> None:
-        """Post-initialization hook to set up sensitive settings.
+    @model_validator(mode="after")
+    def share_secrets(self) -> "Settings":
+        """Share the top-level secrets with the settings sections that use them.
 
-        This method is called after the initial model initialization and is responsible
-        for setting up sensitive configuration values like JWT secret and database
-        passwords. It ensures that these sensitive values are properly set from
-        environment variables or other sources.
+        The JWT secret and database password are read from environment variables
+        or other sources at the top level, then handed to the auth and postgres
+        sections. ``SecretStr`` is immutable, so the same instance is shared
+        instead of unwrapping and re-wrapping the value.
 
-        Args:
-            _context: Context passed during initialization (unused in this
-                      implementation).
+        Returns:
+            Settings: The settings instance with its sections' secrets set.
         """
-        if hasattr(self, "auth"):
-            self.auth.JWT_SECRET = SecretStr(
-                self.JWT_SECRET.get_secret_value(),
-            )
-        if hasattr(self.db, "postgres"):
-            self.db.postgres.PGPASSWORD = SecretStr(self.PGPASSWORD.get_secret_value())
+        self.auth.JWT_SECRET = self.JWT_SECRET
+        self.db.postgres.PGPASSWORD = self.PGPASSWORD
+        return self
 
     @classmethod
     def settings_customise_sources(
@@ -249,8 +311,7 @@ class Settings(BaseSettings):
         def load_toml_settings() -> dict[str, Any]:
             try:
                 toml_path = cls._cfg_toml_path
-                with toml_path.open(mode="rb") as f:
-                    config = tomllib.load(f)
+                config = load_toml(toml_path)
                 logger.info(f"Loaded configuration from file: {toml_path}")
                 return config
             except TOMLDecodeError as e:
@@ -270,3 +331,13 @@ class Settings(BaseSettings):
             dotenv_settings,
             file_secret_settings,
         )
+
+
+@cache
+def get_settings() -> Settings:
+    """Load and cache the Settings instance.
+
+    Returns:
+        Settings: Cached Settings instance
+    """
+    return Settings()
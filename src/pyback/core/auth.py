@@ -1,45 +1,125 @@
-from datetime import UTC, datetime, timedelta
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import cache
+import os
+import time
+from typing import Any
 
 import bcrypt
 import jwt
+from jwt.algorithms import Algorithm
+from jwt.utils import base64url_encode
+import orjson
 
 from pyback.api.dependencies.common import get_auth_settings
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# Provides the signing algorithms and verifies signatures, bypassing the stdlib
+# json.dumps and json.loads used by jwt.encode and jwt.decode
+_jws = jwt.PyJWS()
+
+# bcrypt releases the GIL while hashing, so threads hash in parallel without
+# blocking the event loop. One worker per core keeps a burst of logins from
+# oversubscribing the CPU.
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt",
+)
+
+
+def verify_password(plain_password: bytes, hashed_password: bytes) -> bool:
     """Verifies that a plain text password matches a hashed password.
 
     Args:
-        plain_password (str): The plain text password to verify.
-        hashed_password (str): The hashed password for comparison.
+        plain_password (bytes): The UTF-8 encoded plain text password to verify.
+        hashed_password (bytes): The hashed password for comparison.
 
     Returns:
         bool: True if the passwords match, False otherwise.
     """
     # Hash the plain password with the same salt and compare
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"),
-        hashed_password.encode("utf-8"),
-    )
+    return bcrypt.checkpw(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+def get_password_hash(password: bytes) -> str:
     """Hashes a plain text password using bcrypt.
 
+    The cost factor comes from ``AuthSettings.BCRYPT_ROUNDS``.
+
     Args:
-        password (str): The plain text password to hash.
+        password (bytes): The UTF-8 encoded plain text password to hash.
 
     Returns:
         str: The hashed password.
     """
-    # Generate a salt
-    salt = bcrypt.gensalt()
+    # Generate a salt with the configured cost factor
+    salt = bcrypt.gensalt(rounds=get_auth_settings().BCRYPT_ROUNDS)
     # Hash the password with the generated salt
-    hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
+    hashed_password = bcrypt.hashpw(password, salt)
     # Return the hashed password as a string
     return hashed_password.decode("utf-8")
 
 
+async def verify_password_async(plain_password: bytes, hashed_password: bytes) -> bool:
+    """Verify a password like ``verify_password``, off the event loop.
+
+    Args:
+        plain_password (bytes): The UTF-8 encoded plain text password to verify.
+        hashed_password (bytes): The hashed password for comparison.
+
+    Returns:
+        bool: True if the passwords match, False otherwise.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _bcrypt_executor,
+        verify_password,
+        plain_password,
+        hashed_password,
+    )
+
+
+async def get_password_hash_async(password: bytes) -> str:
+    """Hash a password like ``get_password_hash``, off the event loop.
+
+    Args:
+        password (bytes): The UTF-8 encoded plain text password to hash.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _bcrypt_executor,
+        get_password_hash,
+        password,
+    )
+
+
+@cache
+def _jwt_signing_params() -> tuple[bytes, Algorithm, Any, int]:
+    """Prepare everything a token signature needs, once.
+
+    The header only depends on the configured algorithm, so its encoded
+    segment is built here rather than for every token.
+
+    Returns:
+        tuple[bytes, Algorithm, Any, int]: The encoded header segment followed
+            by a dot, the signing algorithm, the key prepared for it and the
+            default session TTL in seconds.
+    """
+    auth_settings = get_auth_settings()
+    algorithm = _jws.get_algorithm_by_name(auth_settings.JWT_ALGORITHM)
+    key = algorithm.prepare_key(auth_settings.JWT_SECRET.get_secret_value())
+    header = orjson.dumps({"alg": auth_settings.JWT_ALGORITHM, "typ": "JWT"})
+    return (
+        base64url_encode(header) + b".",
+        algorithm,
+        key,
+        auth_settings.JWT_SESSION_TTL_MIN * 60,
+    )
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token with optional custom expiration.
 
@@ -55,18 +135,76 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     Returns:
         str: A JWT access token encoded with the provided data and expiration.
     """
-    to_encode = data.copy()
-    auth_settings = get_auth_settings()
-    if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
-    else:
-        expire = datetime.now(UTC) + timedelta(minutes=auth_settings.SESSION_TTL_MIN)
-    to_encode.update({"exp": expire})
-    encoded_jwt = str(
-        jwt.encode(
-            to_encode,
-            auth_settings.JWT_SECRET.get_secret_value(),
-            algorithm=auth_settings.JWT_ALGORITHM,
-        ),
-    )
-    return encoded_jwt
+    header_segment, algorithm, key, default_ttl = _jwt_signing_params()
+    ttl = expires_delta.total_seconds() if expires_delta else default_ttl
+    # An integer timestamp is what the exp claim holds once encoded anyway
+    to_encode = {**data, "exp": int(time.time() + ttl)}
+    signing_input = header_segment + base64url_encode(orjson.dumps(to_encode))
+    signature = base64url_encode(algorithm.sign(signing_input, key))
+    return (signing_input + b"." + signature).decode("ascii")
+
+
+_CLAIM_NAMES = {"iat": "Issued At", "nbf": "Not Before", "exp": "Expiration Time"}
+
+
+def _int_claim(payload: dict[str, Any], name: str, error: type[Exception]) -> int:
+    try:
+        return int(payload[name])
+    except (TypeError, ValueError):
+        message = f"{_CLAIM_NAMES[name]} claim ({name}) must be an integer."
+        raise error(message) from None
+
+
+def _validate_claims(payload: dict[str, Any]) -> None:
+    """Validate the registered claims the way ``jwt.decode`` does by default.
+
+    No audience or issuer is expected, so a token carrying an ``aud`` claim is
+    rejected and ``iss`` is not checked.
+    """
+    now = time.time()
+    if "iat" in payload and _int_claim(payload, "iat", jwt.InvalidIssuedAtError) > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+    if "nbf" in payload and _int_claim(payload, "nbf", jwt.DecodeError) > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "exp" in payload and _int_claim(payload, "exp", jwt.DecodeError) <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    if payload.get("aud"):
+        raise jwt.InvalidAudienceError("Invalid audience")
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        raise jwt.InvalidSubjectError("Subject must be a string")
+    if "jti" in payload and not isinstance(payload["jti"], str):
+        raise jwt.InvalidJTIError("JWT ID must be a string")
+
+
+def decode_access_token(
+    token: str,
+    key: str | bytes,
+    algorithms: Sequence[str],
+) -> dict[str, Any]:
+    """Verify a JWT access token and return its claims.
+
+    Behaves like ``jwt.decode`` without an audience, but parses the payload
+    with orjson. The ``iat``, ``nbf`` and ``exp`` claims are validated like
+    PyJWT does, numeric values that are not integers included, and tokens
+    with an audience are rejected.
+
+    Args:
+        token (str): The encoded token.
+        key (str | bytes): The key the token was signed with.
+        algorithms (Sequence[str]): The accepted signing algorithms.
+
+    Returns:
+        dict[str, Any]: The claims of the token.
+
+    Raises:
+        jwt.ExpiredSignatureError: If the token has expired.
+        jwt.PyJWTError: If the token is malformed or its signature is invalid.
+    """
+    try:
+        payload = orjson.loads(_jws.decode(token, key, algorithms=algorithms))
+    except orjson.JSONDecodeError as e:
+        raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+    _validate_claims(payload)
+    return payload
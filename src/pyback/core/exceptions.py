@@ -1,7 +1,8 @@
+from functools import cache
 from typing import Any
 
-from fastapi import Request
-from fastapi.responses import ORJSONResponse
+from fastapi import Request, Response
+import orjson
 
 
 class InvalidTokenError(Exception):
@@ -121,6 +122,29 @@ class InternalError(Exception):
         self.detail = detail
 
 
+@cache
+def _default_error_body(exc_type: type[Exception]) -> tuple[str, bytes]:
+    """Serialize the error body for an exception class's default detail once.
+
+    Args:
+        exc_type: Exception class whose ``__init__`` takes ``detail`` as its only
+            defaulted argument.
+
+    Returns:
+        The default detail message and its serialized JSON body.
+    """
+    default_detail = exc_type.__init__.__defaults__[0]
+    return default_detail, orjson.dumps({"detail": default_detail})
+
+
+def _error_body(exc: Any) -> bytes:
+    """Return the JSON error body, reusing the cached one for default details."""
+    default_detail, body = _default_error_body(type(exc))
+    if exc.detail == default_detail:
+        return body
+    return orjson.dumps({"detail": exc.detail})
+
+
 def create_error_handler(status_code: int):
     """Create a generic error handler for the given status code.
 
@@ -131,10 +155,11 @@ def create_error_handler(status_code: int):
         Exception handler function
     """
 
-    async def handler(request: Request, exc: Any) -> ORJSONResponse:
-        return ORJSONResponse(
+    async def handler(request: Request, exc: Any) -> Response:
+        return Response(
+            content=_error_body(exc),
             status_code=status_code,
-            content={"detail": exc.detail},
+            media_type="application/json",
         )
 
     return handler
@@ -149,12 +174,14 @@ def create_auth_error_handler(status_code: int):
     Returns:
         Exception handler function
     """
+    headers = {"WWW-Authenticate": "Bearer"}
 
-    async def handler(request: Request, exc: Any) -> ORJSONResponse:
-        return ORJSONResponse(
+    async def handler(request: Request, exc: Any) -> Response:
+        return Response(
+            content=_error_body(exc),
             status_code=status_code,
-            content={"detail": exc.detail},
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=headers,
+            media_type="application/json",
         )
 
     return handler
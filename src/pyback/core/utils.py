@@ -1,3 +1,8 @@
+import os
+import time
+from uuid import UUID
+
+
 def add(x: int, y: int) -> int:
     """Add two numbers.
 
@@ -11,3 +16,20 @@ def add(x: int, y: int) -> int:
         int: The sum of the two numbers
     """
     return x + y
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits hold the Unix time in milliseconds and the rest is random,
+    so successive IDs sort roughly by creation time. Used as primary key, new
+    rows are then appended at the end of the index instead of at random pages.
+
+    Returns:
+        UUID: A new version 7 UUID.
+    """
+    value = ((time.time_ns() // 1_000_000) << 80) | int.from_bytes(os.urandom(10))
+    # Overwrite the version (0b0111) and variant (0b10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return UUID(int=value)
@@ -7,7 +7,6 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
-import importlib.util
 import sys
 
 # Add the project root directory to the Python path
@@ -27,17 +26,10 @@ if config.config_file_name is not None:
 # Set target metadata
 from pyback.db.models.base import Base
 
-target_metadata = Base.metadata
+# Importing the package registers every model on the metadata
+import pyback.db.models  # noqa: F401
 
-# Import all models dynamically
-models_path = Path(__file__).parent.parent / "models"
-for model_file in models_path.glob("*.py"):
-    if model_file.stem != "__init__" or model_file.stem != "base":
-        module_name = f"db.models.{model_file.stem}"
-        spec = importlib.util.spec_from_file_location(module_name, model_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+target_metadata = Base.metadata
 
 # Set database URL
 database_url = get_postgres_settings().postgres_dsn
@@ -0,0 +1,31 @@
+"""Lowercase user emails
+
+Revision ID: 7b1e52c0d4a9
+Revises: 43cd39b7f960
+Create Date: 2026-10-15 22:15:03.418220
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1e52c0d4a9"
+down_revision: Union[str, None] = "43cd39b7f960"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Emails are now normalized to lowercase by the API models, so existing
+    # rows must match that form to be found by equality lookups. Addresses that
+    # only differ by case make this fail on the unique index and have to be
+    # merged by hand first.
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+
+
+def downgrade() -> None:
+    # The original casing is not recoverable
+    pass
@@ -0,0 +1,2 @@
+# Import every model module so their tables are registered on Base.metadata
+from . import user  # noqa: F401
@@ -22,16 +22,21 @@ class Base(AsyncAttrs, DeclarativeBase):
 
     __abstract__ = True
 
+    # Fetch server generated columns with RETURNING on INSERT and UPDATE, so
+    # written records do not need a separate refresh
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Timestamps are computed by Postgres rather than in Python. Within one
+    # transaction CURRENT_TIMESTAMP is constant, so a new row gets the same
+    # created_at and updated_at, and updates set updated_at in the statement.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.now,
         server_default=text("CURRENT_TIMESTAMP"),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.now,
         server_default=text("CURRENT_TIMESTAMP"),
-        onupdate=datetime.now,
+        onupdate=text("CURRENT_TIMESTAMP"),
         nullable=False,
     )
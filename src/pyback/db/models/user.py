@@ -1,9 +1,8 @@
-import uuid
-
 from sqlalchemy import Boolean, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from pyback.core.utils import uuid7
 from pyback.db.models.base import Base
 
 
@@ -14,7 +13,7 @@ class User(Base):
     It includes personal information, authentication details, and user status flags.
 
     Attributes:
-        id (UUID): Unique identifier for the user, automatically generated.
+        id (UUID): Unique identifier for the user, a time-ordered UUIDv7.
         first_name (str): User's first name, limited to 100 characters.
         last_name (str): User's last name, limited to 100 characters.
         email (str): User's email address, limited to 255 characters, must be unique.
@@ -28,7 +27,9 @@ class User(Base):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        # Time-ordered, so new rows land at the end of the primary key index.
+        # The server default only serves rows inserted with raw SQL.
+        default=uuid7,
         server_default=text("uuid_generate_v4()"),
         nullable=False,
         doc="Unique identifier for the user.",
@@ -68,5 +69,9 @@ class User(Base):
         doc="Flag indicating whether the user account is active.",
     )
 
-    # Adding unique index on the email column
-    __table_args__ = (Index(None, "email", unique=True),)
+    # Adding unique index on the email column, and a partial index covering only
+    # the active users, which are listed without scanning deactivated ones
+    __table_args__ = (
+        Index(None, "email", unique=True),
+        Index(None, "is_active", postgresql_where=text("is_active")),
+    )
@@ -1,19 +1,26 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Sequence
 from contextlib import asynccontextmanager
+from enum import Enum
+from functools import lru_cache
 from typing import Annotated, Any, Generic, TypeVar
 
 from loguru import logger
-from sqlalchemy import select, text
+from sqlalchemy import TextClause, insert, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from pyback.api.dependencies.common import get_postgres_settings
+from pyback.config.settings import PoolMode
 
 
 T = TypeVar("T", bound=SQLModel)
 
+_SELECT_ONE = text("SELECT 1")
+
 
 class PostgresDatabase(Generic[T]):
     """A generic asynchronous PostgreSQL database interface.
@@ -30,6 +37,7 @@ class PostgresDatabase(Generic[T]):
         _dsn (str): Database connection string.
         _debug (bool): Flag to enable debug logging.
         _engine (Any): SQLAlchemy async engine instance.
+        _probe_engine (Any): Separate single-connection engine for health checks.
         _async_session (async_sessionmaker[AsyncSession] | None): Session factory for
             creating database sessions.
     """
@@ -38,11 +46,16 @@ class PostgresDatabase(Generic[T]):
         self,
         dsn: str,
         debug: bool = False,
-        pool_size: int = 20,
+        pool_mode: PoolMode = "sqlalchemy",
+        pool_size: int = 50,
         max_overflow: int = 10,
         pool_timeout: int = 30,
         pool_recycle: int = 1800,
         pool_pre_ping: bool = True,
+        insertmanyvalues_page_size: int = 1000,
+        query_cache_size: int = 1200,
+        stmt_cache_size: int = 512,
+        schema: str | None = None,
     ) -> None:
         """Initialize the PostgreSQL database interface.
 
@@ -50,29 +63,57 @@ class PostgresDatabase(Generic[T]):
             dsn (str): Database connection string (Data Source Name).
             debug (bool, optional): Enable debug mode for SQL query logging.
                 Defaults to False.
+            pool_mode (PoolMode, optional): "sqlalchemy" to keep a connection pool
+                in the application, or "nullpool" to open a connection per checkout
+                when an external pooler such as pgbouncer is in front of Postgres.
+                The pool_* and max_overflow settings only apply to "sqlalchemy".
+                Defaults to "sqlalchemy".
             pool_size (int, optional): The size of the connection pool.
-                Defaults to 20.
+                Defaults to 50.
             max_overflow (int, optional): The maximum number of connections to allow
-                beyond the pool_size. Defaults to 10.
+                beyond the pool_size, -1 for no limit. Defaults to 10.
             pool_timeout (int, optional): Seconds to wait before timing out on getting
                 a connection from the pool. Defaults to 30.
             pool_recycle (int, optional): Seconds after which a connection is recycled.
                 Defaults to 1800 (30 minutes).
             pool_pre_ping (bool, optional): If True, emits a test statement on checkout
                 to verify the connection is still viable. Defaults to True.
+            insertmanyvalues_page_size (int, optional): Maximum number of rows
+                batched into one multi-row INSERT statement. Defaults to 1000.
+            query_cache_size (int, optional): Size of the cache of compiled SQL
+                statements. Defaults to 1200.
+            stmt_cache_size (int, optional): Number of prepared statements cached
+                per connection. Set to 0 behind pgbouncer in transaction mode.
+                Defaults to 512.
+            schema (str | None, optional): Schema searched for tables before
+                "public". Defaults to None, which keeps the server's search_path.
         """
         self._dsn: str = dsn
         self._debug: bool = debug
         self._engine: Any = None
+        self._probe_engine: Any = None
         self._async_session: async_sessionmaker[AsyncSession] | None = None
 
         # Connection pool settings
+        self._pool_mode = pool_mode
         self._pool_size = pool_size
         self._max_overflow = max_overflow
         self._pool_timeout = pool_timeout
         self._pool_recycle = pool_recycle
         self._pool_pre_ping = pool_pre_ping
 
+        # Bulk insert batching
+        self._insertmanyvalues_page_size = insertmanyvalues_page_size
+
+        # Compiled statement cache
+        self._query_cache_size = query_cache_size
+        self._stmt_cache_size = stmt_cache_size
+
+        # Session parameters set on every connection
+        self._server_settings: dict[str, str] = {}
+        if schema is not None:
+            self._server_settings["search_path"] = f'"{schema}", public'
+
         # Statistics
         self._connection_attempts = 0
         self._connection_errors = 0
@@ -91,14 +132,46 @@ class PostgresDatabase(Generic[T]):
             self._connection_attempts += 1
 
             # Create the async engine with pool configuration
+            if self._pool_mode == "nullpool":
+                pool_args: dict[str, Any] = {"poolclass": NullPool}
+            else:
+                pool_args = {
+                    "pool_size": self._pool_size,
+                    "max_overflow": self._max_overflow,
+                    "pool_timeout": self._pool_timeout,
+                    "pool_recycle": self._pool_recycle,
+                    "pool_pre_ping": self._pool_pre_ping,
+                }
+
             self._engine = create_async_engine(
                 self._dsn,
                 echo=self._debug,
-                pool_size=self._pool_size,
-                max_overflow=self._max_overflow,
-                pool_timeout=self._pool_timeout,
-                pool_recycle=self._pool_recycle,
-                pool_pre_ping=self._pool_pre_ping,
+                **pool_args,
+                insertmanyvalues_page_size=self._insertmanyvalues_page_size,
+                query_cache_size=self._query_cache_size,
+                # Reuse server side prepared statements of repeated queries
+                connect_args={
+                    "prepared_statement_cache_size": self._stmt_cache_size,
+                    "statement_cache_size": self._stmt_cache_size,
+                    "server_settings": self._server_settings,
+                },
+            )
+
+            # Health checks get their own connection, so they neither wait behind
+            # nor take a connection from user traffic, and give up quickly
+            self._probe_engine = create_async_engine(
+                self._dsn,
+                pool_size=1,
+                max_overflow=0,
+                pool_timeout=1,
+                connect_args={
+                    "prepared_statement_cache_size": self._stmt_cache_size,
+                    "statement_cache_size": self._stmt_cache_size,
+                    "server_settings": {
+                        **self._server_settings,
+                        "statement_timeout": "500",
+                    },
+                },
             )
 
             # Create the async session maker
@@ -118,7 +191,7 @@ class PostgresDatabase(Generic[T]):
 
         except Exception as e:
             self._connection_errors += 1
-            logger.error(f"Error initializing PostgreSQL connection: {e}")
+            logger.error("Error initializing PostgreSQL connection: {}", e)
             raise
 
     async def disconnect(self) -> None:
@@ -134,9 +207,11 @@ class PostgresDatabase(Generic[T]):
             try:
                 logger.info("Closing PostgreSQL connection...")
                 await self._engine.dispose()
+                if self._probe_engine is not None:
+                    await self._probe_engine.dispose()
                 logger.info("PostgreSQL connection closed successfully.")
             except Exception as e:
-                logger.error(f"Error closing PostgreSQL connection: {e}")
+                logger.error("Error closing PostgreSQL connection: {}", e)
                 raise
 
     @asynccontextmanager
@@ -164,18 +239,20 @@ class PostgresDatabase(Generic[T]):
     async def health_check(self) -> bool:
         """Check if the database connection is healthy.
 
+        Uses the dedicated probe connection, with a 500ms statement timeout.
+
         Returns:
             bool: True if the connection is healthy, False otherwise.
         """
-        if self._engine is None:
+        if self._probe_engine is None:
             return False
 
         try:
-            async with self._engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+            async with self._probe_engine.connect() as conn:
+                await conn.execute(_SELECT_ONE)
             return True
         except Exception as e:
-            logger.warning(f"Database health check failed: {e}")
+            logger.warning("Database health check failed: {}", e)
             return False
 
     def get_stats(self) -> dict[str, Any]:
@@ -189,7 +266,7 @@ class PostgresDatabase(Generic[T]):
             "connection_errors": self._connection_errors,
         }
 
-        if self._engine is not None:
+        if self._engine is not None and self._pool_mode != "nullpool":
             pool = self._engine.pool
             stats.update(
                 {
@@ -228,15 +305,50 @@ class PostgresDatabase(Generic[T]):
             # Use provided session
             query = select(model).filter(*conditions)
             result = await session.exec(query)
-            record = result.one_or_none()
-            return record[0] if record else None
+            return result.scalars().one_or_none()
         else:
             # Create new session
             async with self.session() as session:
                 query = select(model).filter(*conditions)
                 result = await session.exec(query)
-                record = result.one_or_none()
-                return record[0] if record else None
+                return result.scalars().one_or_none()
+
+    async def fetch_one_stmt(
+        self,
+        stmt: Any,
+        params: dict[str, Any] | None = None,
+        session: AsyncSession | None = None,
+    ) -> Any | None:
+        """Fetch a single record with a prebuilt statement.
+
+        Statements built once with ``bindparam`` placeholders skip being
+        rebuilt and re-keyed for the compiled cache on every call.
+
+        Args:
+            stmt (Any): The select statement to execute.
+            params (dict[str, Any] | None, optional): Values of the statement's
+                bound parameters. Defaults to None.
+            session (Optional[AsyncSession], optional): Optional session to use.
+                If None, a new session will be created. Defaults to None.
+
+        Returns:
+            Any | None: The matching record if found, None otherwise.
+
+        Raises:
+            ConnectionError: If the database is not initialized.
+        """
+        if self._async_session is None:
+            raise ConnectionError("Database is not initialized. Call connect() first.")
+
+        if session is not None:
+            # Use provided session
+            result = await session.exec(stmt, params=params)
+            return result.scalars().one_or_none()
+        else:
+            # Create new session
+            async with self.session() as session:
+                result = await session.exec(stmt, params=params)
+                return result.scalars().one_or_none()
 
     async def fetch_all(
         self,
@@ -265,15 +377,46 @@ class PostgresDatabase(Generic[T]):
             # Use provided session
             query = select(model).filter(*conditions)
             result = await session.exec(query)
-            records = result.all()
-            return [record[0] for record in records]
+            return result.scalars().all()
         else:
             # Create new session
             async with self.session() as session:
                 query = select(model).filter(*conditions)
                 result = await session.exec(query)
-                records = result.all()
-                return [record[0] for record in records]
+                return result.scalars().all()
+
+    async def stream(
+        self,
+        model: type[T],
+        *conditions: Any,
+        chunk: int = 1000,
+    ) -> AsyncGenerator[T, None]:
+        """Stream the records that match the given conditions.
+
+        Records are fetched from a server side cursor ``chunk`` rows at a time,
+        so memory use stays bounded and consumers can stop early.
+
+        Args:
+            model (type[T]): The SQLModel class representing the database table.
+            *conditions (Any): Variable number of filter conditions.
+            chunk (int, optional): Number of rows fetched per round trip.
+                Defaults to 1000.
+
+        Yields:
+            T: The matching records.
+
+        Raises:
+            ConnectionError: If the database is not initialized.
+        """
+        if self._async_session is None:
+            raise ConnectionError("Database is not initialized. Call connect() first.")
+
+        async with self.session() as session:
+            query = select(model).filter(*conditions).execution_options(yield_per=chunk)
+            result = await session.stream(query)
+            async for partition in result.scalars().partitions():
+                for record in partition:
+                    yield record
 
     async def execute_with_transaction(
         self,
@@ -315,40 +458,50 @@ class PostgresDatabase(Generic[T]):
                         )
                     else:
                         # Execute raw SQL query with parameters
+                        stmt, verb = _prepare_text(operation)
                         if kwargs.get("parameters"):
-                            stmt = text(operation).params(**kwargs["parameters"])
-                        else:
-                            stmt = text(operation)
+                            stmt = stmt.params(**kwargs["parameters"])
 
                         result = await session.exec(stmt)
 
                         # UPDATE/DELETE. Return the number of rows affected
-                        if operation.upper().startswith(("UPDATE", "DELETE")):
+                        if verb is _Verb.MODIFY:
                             return result.rowcount
 
                         # For SELECT operations, return the results
-                        return result.all() if "SELECT" in operation.upper() else result
+                        return result.all() if verb is _Verb.SELECT else result
 
                 return result
 
             except SQLAlchemyError as e:
-                logger.error(f"Database error occurred: {e}")
+                logger.error("Database error occurred: {}", e)
                 raise
             except Exception as e:
-                logger.error(f"An unexpected error occurred: {e}")
+                logger.error("An unexpected error occurred: {}", e)
                 raise
 
-    async def add(self, model: T, session: AsyncSession | None = None) -> T:
+    async def add(
+        self,
+        model: T,
+        session: AsyncSession | None = None,
+        *,
+        refresh: bool = False,
+    ) -> T:
         """Add a new record to the database.
 
+        Server generated values are already loaded back through RETURNING when
+        the statement is flushed, see ``eager_defaults`` on the models' base.
+
         Args:
             model (T): The model instance to add to the database.
             session (Optional[AsyncSession], optional): Optional session to use.
                 If None, a new session will be created and transaction managed.
                 Defaults to None.
+            refresh (bool, optional): Reload the whole record from the database
+                afterwards. Defaults to False.
 
         Returns:
-            T: The added model instance with refreshed data from the database.
+            T: The added model instance.
 
         Raises:
             ConnectionError: If the database is not initialized.
@@ -360,27 +513,174 @@ class PostgresDatabase(Generic[T]):
             # Use provided session (caller manages transaction)
             session.add(model)
             await session.flush()  # Flush but don't commit - caller manages transaction
-            await session.refresh(model)
+            if refresh:
+                await session.refresh(model)
             return model
         else:
             # Create new session and manage transaction
             async with self.session() as session:
                 session.add(model)
                 await session.commit()
-                await session.refresh(model)
+                if refresh:
+                    await session.refresh(model)
                 return model
 
-    async def update(self, model: T, session: AsyncSession | None = None) -> T:
+    async def insert_returning(
+        self,
+        model: type[T],
+        values: dict[str, Any],
+        conflict_columns: Sequence[str] | None = None,
+        session: AsyncSession | None = None,
+    ) -> T | None:
+        """Insert a new record with a single ``INSERT ... RETURNING`` statement.
+
+        Args:
+            model (type[T]): The SQLModel class representing the database table.
+            values (dict[str, Any]): Column values of the new record.
+            conflict_columns (Sequence[str] | None, optional): Columns of a unique
+                index. If given, a record conflicting on them is not inserted
+                (``ON CONFLICT DO NOTHING``). Defaults to None.
+            session (Optional[AsyncSession], optional): Optional session to use.
+                If None, a new session will be created and transaction managed.
+                Defaults to None.
+
+        Returns:
+            T | None: The inserted record, or None if it conflicted with an
+                existing one.
+
+        Raises:
+            ConnectionError: If the database is not initialized.
+        """
+        if self._async_session is None:
+            raise ConnectionError("Database is not initialized. Call connect() first.")
+
+        stmt = pg_insert(model).values(**values)
+        if conflict_columns is not None:
+            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+        stmt = stmt.returning(model)
+
+        if session is not None:
+            # Use provided session (caller manages transaction)
+            result = await session.exec(stmt)
+            return result.scalars().one_or_none()
+        else:
+            # Create new session and manage transaction
+            async with self.session() as session:
+                result = await session.exec(stmt)
+                record = result.scalars().one_or_none()
+                await session.commit()
+                return record
+
+    async def bulk_add(
+        self,
+        model: type[T],
+        rows: Sequence[dict[str, Any]],
+        session: AsyncSession | None = None,
+    ) -> list[T]:
+        """Add many new records to the database at once.
+
+        The rows are sent as multi-row ``INSERT ... RETURNING`` statements of up
+        to ``insertmanyvalues_page_size`` rows each, rather than one statement
+        per record.
+
+        Args:
+            model (type[T]): The SQLModel class representing the database table.
+            rows (Sequence[dict[str, Any]]): Column values of each new record.
+            session (Optional[AsyncSession], optional): Optional session to use.
+                If None, a new session will be created and transaction managed.
+                Defaults to None.
+
+        Returns:
+            list[T]: The added records, in the order of ``rows``.
+
+        Raises:
+            ConnectionError: If the database is not initialized.
+        """
+        if self._async_session is None:
+            raise ConnectionError("Database is not initialized. Call connect() first.")
+
+        if not rows:
+            return []
+
+        stmt = insert(model).returning(model, sort_by_parameter_order=True)
+
+        if session is not None:
+            # Use provided session (caller manages transaction)
+            result = await session.exec(stmt, params=rows)
+            return result.scalars().all()
+        else:
+            # Create new session and manage transaction
+            async with self.session() as session:
+                result = await session.exec(stmt, params=rows)
+                records = result.scalars().all()
+                await session.commit()
+                return records
+
+    async def bulk_copy(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+        *,
+        synchronous_commit: bool = True,
+    ) -> int:
+        """Load many rows into a table with the binary ``COPY`` protocol.
+
+        Faster than even batched INSERTs for large imports, as Postgres does not
+        parse and plan a statement per row. Column defaults apply to the columns
+        that are left out, but ORM-side defaults do not.
+
+        Args:
+            table_name (str): Name of the table to load into.
+            columns (Sequence[str]): Columns the values of each record map to.
+            records (Iterable[Sequence[Any]]): Rows of values, in ``columns`` order.
+            synchronous_commit (bool, optional): Set to False to not wait for the
+                WAL flush on commit, e.g. for initial seed loads that can simply
+                be retried. Defaults to True.
+
+        Returns:
+            int: The number of rows copied.
+
+        Raises:
+            ConnectionError: If the database is not initialized.
+        """
+        if self._engine is None:
+            raise ConnectionError("Database is not initialized. Call connect() first.")
+
+        async with self._engine.begin() as conn:
+            if not synchronous_commit:
+                await conn.execute(text("SET LOCAL synchronous_commit = OFF"))
+            raw = await conn.get_raw_connection()
+            status = await raw.driver_connection.copy_records_to_table(
+                table_name,
+                records=records,
+                columns=columns,
+            )
+        # The command status is "COPY <rows>"
+        return int(status.rpartition(" ")[2])
+
+    async def update(
+        self,
+        model: T,
+        session: AsyncSession | None = None,
+        *,
+        refresh: bool = False,
+    ) -> T:
         """Update an existing record in the database.
 
+        Server generated values are already loaded back through RETURNING when
+        the statement is flushed, see ``eager_defaults`` on the models' base.
+
         Args:
             model (T): The model instance to update.
             session (Optional[AsyncSession], optional): Optional session to use.
                 If None, a new session will be created and transaction managed.
                 Defaults to None.
+            refresh (bool, optional): Reload the whole record from the database
+                afterwards. Defaults to False.
 
         Returns:
-            T: The updated model instance with refreshed data from the database.
+            T: The updated model instance.
 
         Raises:
             ConnectionError: If the database is not initialized.
@@ -392,16 +692,67 @@ class PostgresDatabase(Generic[T]):
             # Use provided session (caller manages transaction)
             session.add(model)
             await session.flush()
-            await session.refresh(model)
+            if refresh:
+                await session.refresh(model)
             return model
         else:
             # Create new session and manage transaction
             async with self.session() as session:
                 session.add(model)
                 await session.commit()
-                await session.refresh(model)
+                if refresh:
+                    await session.refresh(model)
                 return model
 
+    async def update_returning(
+        self,
+        model: type[T],
+        conditions: Sequence[Any],
+        values: dict[str, Any],
+        session: AsyncSession | None = None,
+    ) -> T | None:
+        """Update the records matching the conditions and return the updated one.
+
+        The update is issued as a single ``UPDATE ... RETURNING`` statement, so the
+        record does not have to be fetched first.
+
+        Args:
+            model (type[T]): The SQLModel class representing the database table.
+            conditions (Sequence[Any]): Filter conditions selecting the record.
+            values (dict[str, Any]): Column values to set.
+            session (Optional[AsyncSession], optional): Optional session to use.
+                If None, a new session will be created and transaction managed.
+                Defaults to None.
+
+        Returns:
+            T | None: The updated record if one matched, None otherwise.
+
+        Raises:
+            ConnectionError: If the database is not initialized.
+        """
+        if self._async_session is None:
+            raise ConnectionError("Database is not initialized. Call connect() first.")
+
+        stmt = (
+            update(model)
+            .where(*conditions)
+            .values(**values)
+            .returning(model)
+            .execution_options(synchronize_session=False)
+        )
+
+        if session is not None:
+            # Use provided session (caller manages transaction)
+            result = await session.exec(stmt)
+            return result.scalars().one_or_none()
+        else:
+            # Create new session and manage transaction
+            async with self.session() as session:
+                result = await session.exec(stmt)
+                record = result.scalars().one_or_none()
+                await session.commit()
+                return record
+
     async def delete(self, model: T, session: AsyncSession | None = None) -> None:
         """Delete a record from the database.
 
@@ -428,13 +779,47 @@ class PostgresDatabase(Generic[T]):
                 await session.commit()
 
 
+class _Verb(Enum):
+    """How the result of a raw SQL operation is returned."""
+
+    SELECT = "select"
+    MODIFY = "modify"
+    OTHER = "other"
+
+
+@lru_cache(maxsize=256)
+def _prepare_text(operation: str) -> tuple[TextClause, _Verb]:
+    """Build the statement of a raw SQL operation and classify it once.
+
+    Args:
+        operation (str): The SQL query string.
+
+    Returns:
+        tuple[TextClause, _Verb]: The statement, and how its result is returned.
+    """
+    upper = operation.upper()
+    if upper.startswith(("UPDATE", "DELETE")):
+        verb = _Verb.MODIFY
+    elif "SELECT" in upper:
+        verb = _Verb.SELECT
+    else:
+        verb = _Verb.OTHER
+    return text(operation), verb
+
+
 # Create database instance with improved pool configuration
+_pg_settings = get_postgres_settings()
 pgdb: PostgresDatabase = PostgresDatabase(
-    str(get_postgres_settings().postgres_dsn),
-    get_postgres_settings().DEBUG,
-    pool_size=20,
-    max_overflow=10,
+    str(_pg_settings.postgres_dsn),
+    _pg_settings.DEBUG,
+    pool_mode=_pg_settings.POOL_MODE,
+    pool_size=_pg_settings.POOL_SIZE,
+    max_overflow=_pg_settings.MAX_OVERFLOW,
     pool_timeout=30,
     pool_recycle=1800,
     pool_pre_ping=True,
+    insertmanyvalues_page_size=1000,
+    query_cache_size=1200,
+    stmt_cache_size=_pg_settings.STMT_CACHE_SIZE,
+    schema=_pg_settings.POSTGRES_SCHEMA,
 )
@@ -1,8 +1,18 @@
+from collections.abc import AsyncIterator
+
 from fastapi_limiter import FastAPILimiter
 from loguru import logger
 import redis.asyncio as redis
 
 from pyback.api.dependencies.common import get_redis_settings
+from pyback.config.rate_limit import SLIDING_WINDOW_SCRIPT, SlidingWindowRateLimiter
+
+
+KEY_PREFIX = "pyback"
+"""Namespace of every key the application stores in Redis."""
+
+SCAN_BATCH_SIZE = 500
+"""Number of keys requested per SCAN call when cleaning the database."""
 
 
 class RedisDatabase:
@@ -40,31 +50,36 @@ class RedisDatabase:
         """
         try:
             logger.info("Initializing Redis connection...")
-            self._client = redis.from_url(
+            # A blocking pool makes bursts wait briefly for a free connection
+            # instead of opening new ones without bound
+            pool = redis.BlockingConnectionPool.from_url(
                 self._dsn,
+                max_connections=100,
+                timeout=2,
                 decode_responses=True,
-                socket_timeout=1,
+                socket_timeout=2,
                 socket_connect_timeout=1,
+                socket_keepalive=True,
+                health_check_interval=30,
                 retry_on_timeout=True,
             )
-            # Test the connection
-            if self._client:
-                await self._client.ping()
+            # The client owns the pool and closes its connections on aclose()
+            self._client = redis.Redis.from_pool(pool)
+            # Test the connection and warm the rate limiter script cache in a
+            # single round trip, so the first limited request does not load it
+            pipe = self._client.pipeline(transaction=False)
+            pipe.ping()
+            pipe.script_load(SLIDING_WINDOW_SCRIPT)
+            _, SlidingWindowRateLimiter.lua_sha = await pipe.execute()
             logger.info("Redis connection initialized successfully.")
-            await FastAPILimiter.init(self._client)
+            # init also loads the library's own script, an extra round trip
+            # at startup only, in exchange for not copying its internals
+            await FastAPILimiter.init(self._client, prefix=f"{KEY_PREFIX}:ratelimit")
             logger.info("FastAPILimiter initialized successfully.")
 
-        except redis.ConnectionError as e:
-            logger.error("Failed to connect to Redis: {}", e)
-            raise
-        except redis.TimeoutError as e:
-            logger.error("Redis connection timed out: {}", e)
-            raise
-        except redis.RedisError as e:
-            logger.error("Redis error: {}", e)
-            raise
         except Exception as e:
-            logger.error(f"Error initializing Redis connection: {e}")
+            # The repr names the failure, e.g. ConnectionError or TimeoutError
+            logger.error("Error initializing Redis connection: {!r}", e)
             raise
 
     async def disconnect(self) -> None:
@@ -84,35 +99,114 @@ class RedisDatabase:
                 await FastAPILimiter.close()
                 await self._client.aclose()
                 logger.info("Redis connection closed")
-            except redis.ConnectionError as e:
-                logger.error("Error closing Redis connection: {}", e)
-                raise
-            except redis.RedisError as e:
-                logger.error("Redis error: {}", e)
-                raise
-            except redis.TimeoutError as e:
-                logger.error("Redis connection timed out: {}", e)
-                raise
             except Exception as e:
-                logger.error("Error closing Redis connection: {}", e)
+                logger.error("Error closing Redis connection: {!r}", e)
                 raise
 
-    async def clean(self) -> None:
-        """Flush all data from the Redis database.
+    async def get(self, key: str) -> str | None:
+        """Get the value of a key.
+
+        Args:
+            key (str): The key to read.
+
+        Returns:
+            str | None: The value, or None if the key does not exist or the
+                client is not connected.
+        """
+        if self._client is None:
+            return None
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: str | bytes, ttl: int) -> None:
+        """Set the value of a key, expiring after a number of seconds.
+
+        Args:
+            key (str): The key to write.
+            value (str | bytes): The value to store.
+            ttl (int): Time to live of the key, in seconds.
+        """
+        if self._client is not None:
+            await self._client.set(key, value, ex=ttl)
+
+    async def mget(self, *keys: str) -> list[str | None]:
+        """Get the values of several keys in one round trip.
+
+        Args:
+            *keys (str): The keys to read.
+
+        Returns:
+            list[str | None]: The values in the order of the keys, None for
+                missing keys or every key if the client is not connected.
+        """
+        if self._client is None:
+            return [None] * len(keys)
+        return await self._client.mget(keys)
+
+    async def incr(self, key: str, ttl: int) -> int | None:
+        """Increment a counter and reset its expiry, atomically.
+
+        Args:
+            key (str): The key of the counter, created at 0 if missing.
+            ttl (int): Time to live of the counter, in seconds.
+
+        Returns:
+            int | None: The incremented value, None if the client is not
+                connected.
+        """
+        if self._client is None:
+            return None
+        pipe = self._client.pipeline(transaction=True)
+        pipe.incr(key)
+        pipe.expire(key, ttl)
+        value, _ = await pipe.execute()
+        return value
 
-        This method removes all keys from the current database, effectively
-        clearing all stored data.
+    async def unlink(self, *keys: str) -> None:
+        """Delete keys, reclaiming their memory in the background.
+
+        Args:
+            *keys (str): The keys to delete.
+        """
+        if self._client is not None and keys:
+            await self._client.unlink(*keys)
+
+    async def clean(self, pattern: str = f"{KEY_PREFIX}:*") -> None:
+        """Delete the application's keys from the Redis database.
+
+        Only keys matching ``pattern`` are removed, other data sharing the Redis
+        instance is left alone. Keys are found with ``SCAN``, which does not
+        block the server like ``KEYS``, and each scanned page is freed with a
+        single ``UNLINK``, which reclaims the memory in the background.
+
+        Args:
+            pattern (str, optional): Glob-style pattern of the keys to delete.
+                Defaults to every key under the application prefix.
 
         Raises:
-            Exception: If there's an error flushing the Redis database.
+            Exception: If there's an error deleting the keys.
         """
         if self._client is not None:
             try:
-                await self._client.flushall()
+                async for keys in self._scan_batches(pattern):
+                    await self._client.unlink(*keys)
             except Exception as e:
-                logger.error("Error flushing Redis database: {}", e)
+                logger.error("Error cleaning Redis database: {}", e)
                 raise
 
+    async def _scan_batches(self, pattern: str) -> AsyncIterator[list[str]]:
+        """Yield the non-empty pages of keys matching a pattern."""
+        cursor = 0
+        while True:
+            cursor, keys = await self._client.scan(
+                cursor=cursor,
+                match=pattern,
+                count=SCAN_BATCH_SIZE,
+            )
+            if keys:
+                yield keys
+            if cursor == 0:
+                return
+
 
 redis_db: RedisDatabase = RedisDatabase(str(get_redis_settings().redis_dsn))
 """
@@ -1,55 +1,83 @@
+from collections.abc import AsyncGenerator
 from uuid import UUID
 
+from sqlalchemy import bindparam, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from pyback.api.models.user import UserCreate, UserUpdate
 from pyback.db.models.user import User
 from pyback.db.postgres import PostgresDatabase
 
 
+# Lookups built once, only their bound values change between calls
+_GET_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_GET_BY_ID = select(User).where(User.id == bindparam("uid"))
+
+
 class UserRepository:
     """Handles database interactions for the User entity."""
 
-    def __init__(self, db: PostgresDatabase):
+    def __init__(self, db: PostgresDatabase, session: AsyncSession | None = None):
+        """Initialize the repository.
+
+        Args:
+            db (PostgresDatabase): Database the users are stored in.
+            session (AsyncSession | None, optional): Session shared by every query
+                of the repository, whose transaction is managed by the caller. If
+                None, each query runs in its own session. Defaults to None.
+        """
         self.db = db
+        self.session = session
 
     async def get_by_email(self, email: str) -> User | None:
         """Fetch a user by email."""
-        return await self.db.fetch_one(User, User.email == email)
+        return await self.db.fetch_one_stmt(
+            _GET_BY_EMAIL,
+            {"email": email},
+            session=self.session,
+        )
 
     async def get_by_id(self, user_id: UUID) -> User | None:
         """Fetch a user by ID."""
-        return await self.db.fetch_one(User, User.id == user_id)
+        return await self.db.fetch_one_stmt(
+            _GET_BY_ID,
+            {"uid": user_id},
+            session=self.session,
+        )
 
     async def create(self, user: UserCreate, hashed_password: str) -> User:
         """Create a new user."""
-        # Check if user already exists by email
-        existing_user = await self.get_by_email(user.email)
-        if existing_user:
+        # A single round trip, the unique index on email detects existing users
+        new_user = await self.db.insert_returning(
+            User,
+            {
+                "email": user.email,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "hashed_password": hashed_password,
+                "is_active": True,
+                "is_admin": False,
+            },
+            conflict_columns=["email"],
+            session=self.session,
+        )
+        if new_user is None:
             raise ValueError("User with this email already exists")
 
-        new_user = User()
-        new_user.email = user.email
-        new_user.first_name = user.first_name
-        new_user.last_name = user.last_name
-        new_user.hashed_password = hashed_password
-        new_user.is_active = True
-        new_user.is_admin = False
-
-        return await self.db.add(new_user)
+        return new_user
 
     async def update(self, user_id: UUID, user_update: UserUpdate) -> User | None:
         """Update user information."""
-        user = await self.get_by_id(user_id)
-        if not user:
-            return None
-
         update_data = user_update.model_dump(exclude_unset=True)
         if not update_data:
-            return user
-
-        for key, value in update_data.items():
-            setattr(user, key, value)
+            return await self.get_by_id(user_id)
 
-        return await self.db.update(user)
+        return await self.db.update_returning(
+            User,
+            [User.id == user_id],
+            update_data,
+            session=self.session,
+        )
 
     async def update_password(
         self,
@@ -57,31 +85,35 @@ class UserRepository:
         new_hashed_password: str,
     ) -> User | None:
         """Update the user's password."""
-        user = await self.get_by_id(user_id)
-        if user is None:
-            return None
-
-        user.hashed_password = new_hashed_password
-        return await self.db.update(user)
+        return await self.db.update_returning(
+            User,
+            [User.id == user_id],
+            {"hashed_password": new_hashed_password},
+            session=self.session,
+        )
 
     async def delete(self, user_id: UUID) -> User | None:
         """Soft delete a user by setting is_active to False."""
-        user = await self.get_by_id(user_id)
-        if user is None:
-            return None
+        return await self.db.update_returning(
+            User,
+            [User.id == user_id],
+            {"is_active": False},
+            session=self.session,
+        )
 
-        user.is_active = False
-        return await self.db.update(user)
+    def list_active_users(self) -> AsyncGenerator[User, None]:
+        """Stream all active users.
 
-    async def list_active_users(self) -> list[User]:
-        """List all active users."""
-        return await self.db.fetch_all(User, User.is_active)
+        Always runs in a session of its own, as the stream may be consumed after
+        the repository's session has been closed.
+        """
+        return self.db.stream(User, User.is_active)
 
     async def reactivate_user(self, user_id: UUID) -> User | None:
         """Reactivate a soft-deleted user."""
-        user = await self.get_by_id(user_id)
-        if user is None:
-            return None
-
-        user.is_active = True
-        return await self.db.update(user)
+        return await self.db.update_returning(
+            User,
+            [User.id == user_id],
+            {"is_active": True},
+            session=self.session,
+        )
@@ -5,13 +5,12 @@ from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
 from loguru import logger
-import uvicorn
 
-from pyback.api.dependencies.common import get_settings
 from pyback.api.middleware.processing_time import ProcessingTimeMiddleware
 from pyback.api.models.common import Tags
 from pyback.api.routes import auth, root, users
 from pyback.config.logging_config import initialize_logging
+from pyback.config.settings import get_settings
 from pyback.core.exceptions import (
     BadRequestError,
     ConflictError,
@@ -27,6 +26,27 @@ from pyback.core.exceptions import (
 )
 from pyback.db.postgres import pgdb
 from pyback.db.redis import redis_db
+from pyback.db.repositories.users import UserRepository
+from pyback.services.auth import AuthService
+
+
+# Built once at import, the handlers do not depend on the application. The
+# 401 handler is shared by the authentication errors.
+_unauthorized_handler = create_auth_error_handler(status.HTTP_401_UNAUTHORIZED)
+_EXCEPTION_HANDLERS = (
+    (InvalidTokenError, _unauthorized_handler),
+    (ExpiredTokenError, _unauthorized_handler),
+    (InvalidCredentialsError, _unauthorized_handler),
+    (UnauthorizedError, create_error_handler(status.HTTP_403_FORBIDDEN)),
+    (BadRequestError, create_error_handler(status.HTTP_400_BAD_REQUEST)),
+    (NotFoundError, create_error_handler(status.HTTP_404_NOT_FOUND)),
+    (ConflictError, create_error_handler(status.HTTP_409_CONFLICT)),
+    (
+        ValidationExceptionError,
+        create_error_handler(status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ),
+    (InternalError, create_error_handler(status.HTTP_500_INTERNAL_SERVER_ERROR)),
+)
 
 
 def create_application() -> FastAPI:
@@ -45,6 +65,8 @@ def create_application() -> FastAPI:
         root_path="/api/v1",
     )
 
+    # Middleware added last runs first. CORS sits inside the processing time
+    # middleware, so preflights it answers are timed like any other request.
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -78,9 +100,20 @@ async def lifespan(app: FastAPI):
     try:
         initialize_logging()
         logger.info("🚀 Starting up application...")
+        # Checked once here, the DB dependencies hand them out unchecked
+        if pgdb is None:
+            raise RuntimeError("PostgreSQL session manager instance not initialized")
+        if redis_db is None:
+            raise RuntimeError("Redis client manager instance not initialized")
         await pgdb.connect()
+        app.state.pgdb = pgdb
         logger.info("Database connected")
+        # Authentication runs on most requests and mostly hits its cache, so its
+        # service is built once. User services are bound to each request's
+        # session, see get_user_service.
+        app.state.auth_service = AuthService(UserRepository(pgdb))
         await redis_db.connect()
+        app.state.redis_db = redis_db
         logger.info("Redis connected")
         yield
     except Exception as e:
@@ -98,23 +131,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
-    exception_handlers = {
-        InvalidTokenError: create_auth_error_handler(status.HTTP_401_UNAUTHORIZED),
-        ExpiredTokenError: create_auth_error_handler(status.HTTP_401_UNAUTHORIZED),
-        InvalidCredentialsError: create_auth_error_handler(
-            status.HTTP_401_UNAUTHORIZED,
-        ),
-        UnauthorizedError: create_error_handler(status.HTTP_403_FORBIDDEN),
-        BadRequestError: create_error_handler(status.HTTP_400_BAD_REQUEST),
-        NotFoundError: create_error_handler(status.HTTP_404_NOT_FOUND),
-        ConflictError: create_error_handler(status.HTTP_409_CONFLICT),
-        ValidationExceptionError: create_error_handler(
-            status.HTTP_422_UNPROCESSABLE_ENTITY,
-        ),
-        InternalError: create_error_handler(status.HTTP_500_INTERNAL_SERVER_ERROR),
-    }
-
-    for exception_class, handler in exception_handlers.items():
+    for exception_class, handler in _EXCEPTION_HANDLERS:
         app.add_exception_handler(exception_class, handler)
 
 
@@ -138,13 +155,21 @@ app = get_application()
 
 def main():
     """Run the FastAPI application using Uvicorn server."""
+    # Only needed to serve, importing the application alone does not load it
+    import uvicorn
+
     settings = get_settings()
     uvicorn.run(
         "pyback.main:app",
         host=settings.app.SERVER_HOST,
         port=settings.app.SERVER_PORT,
         reload=settings.app.SERVER_RELOAD,
+        # Each worker is a process with its own event loop, reloading only
+        # supports a single one
+        workers=None if settings.app.SERVER_RELOAD else settings.app.SERVER_WORKERS,
         log_level=settings.app.SERVER_LOG_LEVEL,
+        loop="uvloop",
+        http="httptools",
     )
 
 
@@ -1,16 +1,26 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+import hashlib
+import math
+import time
 from typing import Annotated
+from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import Depends
-import jwt
 from jwt import PyJWTError
 from jwt.exceptions import ExpiredSignatureError
+from loguru import logger
+import orjson
+from redis.exceptions import RedisError
 
 from pyback.api.dependencies.common import get_auth_settings
-from pyback.api.dependencies.db import get_db
-from pyback.api.models.auth import Token, TokenData
+from pyback.api.models.auth import TokenData
 from pyback.config.settings import AuthSettings
-from pyback.core.auth import create_access_token, verify_password
+from pyback.core.auth import (
+    create_access_token,
+    decode_access_token,
+    verify_password_async,
+)
 from pyback.core.exceptions import (
     ExpiredTokenError,
     InvalidCredentialsError,
@@ -18,9 +28,109 @@ from pyback.core.exceptions import (
     NotFoundError,
 )
 from pyback.db.models.user import User
+from pyback.db.postgres import pgdb
+from pyback.db.redis import KEY_PREFIX, redis_db
 from pyback.db.repositories.users import UserRepository
 
 
+USER_CACHE_TTL = 60
+"""Seconds an active user looked up by email is kept in Redis."""
+
+USER_VERSION_TTL = 2 * USER_CACHE_TTL
+"""Seconds a user's version is kept in Redis after its last change.
+
+Versions outlive the cache entries they guard, so a version that expired back
+to 0 cannot match an entry cached before the change.
+"""
+
+# The password hash never leaves the database, users restored from Redis only
+# serve authenticated requests, login always reads the row
+_CACHED_USER_COLUMNS = tuple(
+    column.key for column in User.__table__.columns if column.key != "hashed_password"
+)
+
+
+# Users resolved from a token, keyed by a digest of the token. Each entry also
+# carries the token's expiry so a cache hit never outlives the token itself, and
+# the version of the user it was resolved at. Versions are kept in Redis and
+# bumped on every change, so a hit is only served while the version read from
+# Redis still matches, whichever worker made the change.
+_current_user_cache: TTLCache[bytes, tuple[User, float, int]] = TTLCache(
+    maxsize=10_000,
+    ttl=60,
+)
+
+# Decoded tokens, so a token is only verified once while the user cache is
+# being refilled after a change. Entries also carry the token's expiry.
+_token_data_cache: TTLCache[bytes, tuple[TokenData, float]] = TTLCache(
+    maxsize=10_000,
+    ttl=30,
+)
+
+# Tokens that failed verification, remembered briefly so a flood of the same
+# bad token does not cost a signature check per request
+_rejected_token_cache: TTLCache[bytes, type[Exception]] = TTLCache(
+    maxsize=10_000,
+    ttl=5,
+)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2s(token.encode(), digest_size=16).digest()
+
+
+def _user_cache_key(email: str) -> str:
+    return f"{KEY_PREFIX}:user:email:{email}"
+
+
+def _user_version_key(email: str) -> str:
+    return f"{KEY_PREFIX}:user:version:{email}"
+
+
+def _parse_version(raw: str | None) -> int:
+    return 0 if raw is None else int(raw)
+
+
+def _dump_cached_user(user: User, version: int) -> bytes:
+    # asyncpg returns its own UUID type, which orjson leaves to the default
+    values = {key: getattr(user, key) for key in _CACHED_USER_COLUMNS}
+    return orjson.dumps({"version": version, "user": values}, default=str)
+
+
+def _load_cached_user(raw: str) -> tuple[User, int]:
+    cached = orjson.loads(raw)
+    data = cached["user"]
+    data["id"] = UUID(data["id"])
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+    return User(**data), cached["version"]
+
+
+async def forget_cached_user(email: str) -> None:
+    """Invalidate every cached lookup of a user, in all the workers.
+
+    Must be called once a change to the user is committed, so deactivations
+    and privilege changes take effect immediately rather than once the cache
+    entries expire. Bumping the user's version in Redis makes both the Redis
+    entry and the in-process ones of every worker stale. If Redis fails, the
+    error is logged and this worker's in-process lookups are dropped, the other
+    workers keep theirs until they expire.
+
+    Args:
+        email (str): The email address of the user.
+    """
+    try:
+        await redis_db.incr(_user_version_key(email), USER_VERSION_TTL)
+    except RedisError as e:
+        logger.warning("Error invalidating user in the Redis cache: {!r}", e)
+        clear_current_user_cache()
+
+
+def clear_current_user_cache() -> None:
+    """Drop every cached token-to-user lookup of this process."""
+    _current_user_cache.clear()
+
+
 class AuthService:
     """Service class handling authentication and authorization business logic.
 
@@ -32,15 +142,37 @@ class AuthService:
         user_repo (UserRepository): Repository for user-related database operations.
     """
 
-    def __init__(self, user_repo: UserRepository | None):
+    def __init__(
+        self,
+        user_repo: UserRepository | None,
+        auth_settings: AuthSettings | None = None,
+    ):
         """Initialize the AuthService.
 
         Args:
             user_repo (UserRepository | None): Repository for user operations.
                 If None, creates a new repository using the default database
                 connection.
+            auth_settings (AuthSettings | None, optional): Settings whose JWT
+                secret and algorithm are read once here. Defaults to the
+                application's authentication settings.
         """
-        self.user_repo = user_repo or UserRepository(get_db())
+        self.user_repo = user_repo or UserRepository(pgdb)
+        self._auth_settings = auth_settings or get_auth_settings()
+        self._jwt_params = self._read_jwt_params(self._auth_settings)
+
+    @staticmethod
+    def _read_jwt_params(auth_settings: AuthSettings) -> tuple[str, tuple[str, ...]]:
+        """Read the JWT key and the accepted algorithms from the settings.
+
+        Raises:
+            ValueError: If the JWT secret is not set.
+        """
+        if auth_settings.JWT_SECRET is None:
+            raise ValueError("JWT_SECRET must be set in AuthSettings")
+        return auth_settings.JWT_SECRET.get_secret_value(), (
+            auth_settings.JWT_ALGORITHM,
+        )
 
     async def get_active_user_by_email(self, email: str) -> User | None:
         """Retrieve an active user by their email address.
@@ -62,6 +194,48 @@ class AuthService:
             raise NotFoundError
         return user
 
+    async def _get_cached_active_user(self, email: str) -> tuple[User, int | None]:
+        """Retrieve an active user by email, through the Redis user cache.
+
+        The user's version is read along with the cached user, in one round
+        trip, and an entry cached at another version is ignored. A lookup that
+        raced with a change therefore cannot serve the old user once the change
+        bumps the version. Users restored from the cache carry no password
+        hash. When Redis is unavailable the user is read from the database.
+
+        Returns:
+            tuple[User, int | None]: The user and its current version, None if
+                the version could not be read.
+        """
+        key = _user_cache_key(email)
+        try:
+            raw_version, raw = await redis_db.mget(_user_version_key(email), key)
+        except RedisError as e:
+            logger.warning("Error reading user from the Redis cache: {!r}", e)
+            return await self.get_active_user_by_email(email), None
+        version = _parse_version(raw_version)
+        if raw is not None:
+            user, cached_version = _load_cached_user(raw)
+            if cached_version == version:
+                return user, version
+
+        # Raises for unknown and inactive users, only active ones are cached
+        user = await self.get_active_user_by_email(email)
+        try:
+            await redis_db.set(key, _dump_cached_user(user, version), USER_CACHE_TTL)
+        except RedisError as e:
+            logger.warning("Error writing user to the Redis cache: {!r}", e)
+        return user, version
+
+    @staticmethod
+    async def _get_user_version(email: str) -> int | None:
+        """Read a user's current version, None if Redis is unavailable."""
+        try:
+            return _parse_version(await redis_db.get(_user_version_key(email)))
+        except RedisError as e:
+            logger.warning("Error reading user version from Redis: {!r}", e)
+            return None
+
     async def get_current_active_user(
         self,
         token,
@@ -69,6 +243,12 @@ class AuthService:
     ) -> User:
         """Get the current active user from a JWT token.
 
+        Results are cached in-process for a short time, keyed by the token, so
+        repeated requests with the same token skip both the signature check and
+        the database lookup. A hit costs one Redis read, checking that the user
+        has not changed since. Users are also cached in Redis by email, shared
+        by every worker and by all the tokens of a user.
+
         Args:
             token: The JWT token to validate.
             auth_settings (AuthSettings): Authentication settings for token validation.
@@ -79,13 +259,26 @@ class AuthService:
         Raises:
             InvalidCredentialsError: If the token is invalid or user not found.
         """
+        cache_key = _token_cache_key(token)
+        cached = _current_user_cache.get(cache_key)
+        if cached is not None:
+            user, expires_at, version = cached
+            if (
+                expires_at > time.time()
+                and await self._get_user_version(user.email) == version
+            ):
+                return user
+
         token_data = await self.get_token_data(token, auth_settings)
         if token_data is None or token_data.email is None:
             raise InvalidCredentialsError
         token_email: str = token_data.email
-        user = await self.get_active_user_by_email(token_email)
+        user, version = await self._get_cached_active_user(token_email)
         if user is None:
             raise NotFoundError
+        if version is not None:
+            expires_at = math.inf if token_data.exp is None else token_data.exp
+            _current_user_cache[cache_key] = (user, expires_at, version)
         return user
 
     async def authenticate(self, email: str, password: str) -> User | None:
@@ -104,7 +297,10 @@ class AuthService:
             NotFoundError: If the user is found but not active.
         """
         user = await self.get_active_user_by_email(email)
-        if user and verify_password(password, user.hashed_password):
+        if user and await verify_password_async(
+            password.encode("utf-8"),
+            user.hashed_password.encode("utf-8"),
+        ):
             return user
         return None
 
@@ -112,7 +308,7 @@ class AuthService:
         self,
         user: User,
         auth_settings: Annotated[AuthSettings, Depends(get_auth_settings)],
-    ) -> Token:
+    ) -> str:
         """Generate a JWT access token for a user.
 
         Args:
@@ -120,18 +316,17 @@ class AuthService:
             auth_settings (AuthSettings): Authentication settings for token generation.
 
         Returns:
-            Token: An object containing the generated access token.
+            str: The encoded access token.
         """
         if auth_settings.JWT_EXPIRE_MINUTES is None:
             raise ValueError("JWT_EXPIRE_MINUTES must be set in AuthSettings")
         access_token_expires = timedelta(
             minutes=auth_settings.JWT_EXPIRE_MINUTES,
         )
-        access_token = create_access_token(
+        return create_access_token(
             data={"sub": user.email},
             expires_delta=access_token_expires,
         )
-        return Token(access_token=access_token)
 
     async def get_token_data(
         self,
@@ -140,30 +335,49 @@ class AuthService:
     ) -> TokenData:
         """Decode and validate a JWT token.
 
+        Both decoded and rejected tokens are cached for a short time, keyed by a
+        digest of the token. A decoded token is only served from the cache
+        until it expires. No lock guards concurrent misses on the same token:
+        decoding never awaits, so it cannot interleave with another request.
+
         Args:
             token: The JWT token to decode and validate.
             auth_settings (AuthSettings): Authentication settings for token validation.
 
         Returns:
-            TokenData: The decoded token data containing the user's email.
+            TokenData: The decoded token data containing the user's email and
+                the token expiry.
 
         Raises:
             ExpiredTokenError: If the token has expired.
             InvalidTokenError: If the token is malformed or invalid.
         """
-        if auth_settings.JWT_SECRET is None:
-            raise ValueError("JWT_SECRET must be set in AuthSettings")
+        cache_key = _token_cache_key(token)
+        cached = _token_data_cache.get(cache_key)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+        rejected = _rejected_token_cache.get(cache_key)
+        if rejected is not None:
+            raise rejected
+
+        # The settings the service was built with are the ones always passed in
+        if auth_settings is self._auth_settings:
+            key, algorithms = self._jwt_params
+        else:
+            key, algorithms = self._read_jwt_params(auth_settings)
         try:
-            payload = jwt.decode(
-                token,
-                auth_settings.JWT_SECRET.get_secret_value(),
-                algorithms=[auth_settings.JWT_ALGORITHM],
-            )
+            payload = decode_access_token(token, key, algorithms)
             email: str = payload.get("sub")
             if email is None:
                 raise InvalidTokenError
-            return TokenData(email=email)
+            token_data = TokenData(email=email, exp=payload.get("exp"))
         except ExpiredSignatureError:
+            _rejected_token_cache[cache_key] = ExpiredTokenError
             raise ExpiredTokenError
-        except PyJWTError:
+        except (PyJWTError, InvalidTokenError):
+            _rejected_token_cache[cache_key] = InvalidTokenError
             raise InvalidTokenError
+
+        expires_at = math.inf if token_data.exp is None else token_data.exp
+        _token_data_cache[cache_key] = (token_data, expires_at)
+        return token_data
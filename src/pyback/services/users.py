@@ -1,25 +1,65 @@
+import asyncio
+from collections.abc import AsyncGenerator
 from uuid import UUID
 
-from pyback.api.dependencies.db import get_db
+from sqlalchemy import event
+
+from pyback.api.dependencies.db import AFTER_COMMIT_TASKS
 from pyback.api.models.user import UserCreate, UserUpdate
-from pyback.core.auth import get_password_hash
+from pyback.core.auth import get_password_hash_async
 from pyback.db.models.user import User
+from pyback.db.postgres import pgdb
 from pyback.db.repositories.users import UserRepository
+from pyback.services.auth import forget_cached_user
+
+
+# Cache invalidations started after a commit, referenced until they finish so
+# they are not garbage collected midway
+_pending_invalidations: set[asyncio.Task] = set()
 
 
 class UserService:
     """Handles business logic for user management."""
 
     def __init__(self, user_repo: UserRepository | None):
-        self.user_repo = user_repo or UserRepository(get_db())
+        self.user_repo = user_repo or UserRepository(pgdb)
+
+    async def _invalidate_user_cache(self, user: User | None) -> None:
+        """Clear the cached authenticated users once the change is committed.
+
+        Clearing earlier would let a concurrent request cache the old row again
+        before the transaction of the request's session commits. The Redis
+        update is registered on the session, the request awaits it before
+        responding.
+
+        Args:
+            user (User | None): The modified user, None if it was not found.
+        """
+        if user is None:
+            return
+        session = self.user_repo.session
+        if session is None:
+            await forget_cached_user(user.email)
+            return
+
+        def on_commit(_) -> None:
+            # Commit events are synchronous, Redis is updated in a task
+            task = asyncio.get_running_loop().create_task(
+                forget_cached_user(user.email),
+            )
+            _pending_invalidations.add(task)
+            task.add_done_callback(_pending_invalidations.discard)
+            session.info.setdefault(AFTER_COMMIT_TASKS, []).append(task)
+
+        event.listen(session.sync_session, "after_commit", on_commit, once=True)
 
-    def hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt."""
-        return str(get_password_hash(password))
+    async def hash_password(self, password: str) -> str:
+        """Hash a password using bcrypt, in a worker thread."""
+        return await get_password_hash_async(password.encode("utf-8"))
 
     async def create_user(self, user: UserCreate) -> User:
         """Creates a new user with a hashed password."""
-        hashed_password = self.hash_password(user.password)
+        hashed_password = await self.hash_password(user.password)
         return await self.user_repo.create(user, hashed_password)
 
     async def get_user(self, user_id: UUID) -> User | None:
@@ -30,9 +70,9 @@ class UserService:
         """Get a user by email."""
         return await self.user_repo.get_by_email(email)
 
-    async def list_active_users(self) -> list[User]:
-        """Get all active users."""
-        return await self.user_repo.list_active_users()
+    def list_active_users(self) -> AsyncGenerator[User, None]:
+        """Stream all active users."""
+        return self.user_repo.list_active_users()
 
     async def update_user(
         self,
@@ -40,17 +80,22 @@ class UserService:
         user_update: UserUpdate,
     ) -> User | None:
         """Update user information."""
-        return await self.user_repo.update(user_id, user_update)
+        user = await self.user_repo.update(user_id, user_update)
+        await self._invalidate_user_cache(user)
+        return user
 
     async def update_password(self, user_id: UUID, new_password: str) -> None:
         """Update a user's password."""
-        hashed_password = self.hash_password(new_password)
-        await self.user_repo.update_password(user_id, hashed_password)
+        hashed_password = await self.hash_password(new_password)
+        user = await self.user_repo.update_password(user_id, hashed_password)
+        await self._invalidate_user_cache(user)
 
     async def delete_user(self, user_id: UUID) -> None:
         """Soft delete a user."""
-        await self.user_repo.delete(user_id)
+        user = await self.user_repo.delete(user_id)
+        await self._invalidate_user_cache(user)
 
     async def reactivate_user(self, user_id: UUID) -> None:
         """Reactivate a soft-deleted user."""
-        await self.user_repo.reactivate_user(user_id)
+        user = await self.user_repo.reactivate_user(user_id)
+        await self._invalidate_user_cache(user)
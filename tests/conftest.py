@@ -1,66 +1,175 @@
+import os
+
 import pytest
-from pyback.api.dependencies.db import pgdb
-from pyback.api.dependencies.db import redis_db
-from fastapi.testclient import TestClient
-from pyback.main import app
+import pytest_asyncio
+from redis.asyncio import Redis
+from sqlalchemy import text
+from pyback.config.settings import get_settings
+
+_REDIS_DATABASES = 16
+
+# Hash strength is not under test, the minimum cost keeps each hash around 1ms
+get_settings().auth.BCRYPT_ROUNDS = 4
+
+# Each pytest-xdist worker gets a Postgres schema and a Redis database of its
+# own. Set before the application and its connections are built below. Redis
+# has 16 databases, the worker count is capped with --maxprocesses to match.
+_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _worker is not None:
+    _redis_db = int(_worker.removeprefix("gw"))
+    if _redis_db >= _REDIS_DATABASES:
+        raise pytest.UsageError(
+            f"At most {_REDIS_DATABASES} xdist workers are supported, "
+            "each needs a Redis database of its own"
+        )
+    get_settings().db.postgres.POSTGRES_SCHEMA = f"test_{_worker}"
+    get_settings().db.redis.REDIS_DB = _redis_db
+
+from pyback.api.dependencies.common import get_postgres_settings, get_redis_settings
+from pyback.db.models.base import metadata
+from pyback.db.models.user import User  # noqa: F401, registers the users table
+from pyback.db.postgres import PostgresDatabase
+from httpx import ASGITransport, AsyncClient
+from pyback.services.auth import clear_current_user_cache
 from .middleware import TestClientIPOverrideMiddleware
 
 admin_user_data = {
     "email": "admin@example.com",
     "password": "adminpass123",
-    "hashed_password": "$2b$12$fPKlXqsWsXHfDaHz90J90uRBdlzDwlEM2i92Z/Y.lD0WnXdbirCQa",
+    # Hashed with the same minimum cost, verifying uses the cost of the hash
+    "hashed_password": "$2b$04$NbBgpQzurqSWuCwSaZiiEeFWUeD5.dolFqfL3Gy9ito3nmDKI.QY.",
     "first_name": "Admin",
     "last_name": "User",
 }
 
 
-@pytest.fixture(autouse=True)
-async def cleanup():
-    yield
-    await pgdb.connect()
-    await pgdb.execute_with_transaction('TRUNCATE TABLE "users"')
-    await pgdb.disconnect()
-    await redis_db.connect()
-    await redis_db.clean()  # Clear all rate limit data
-    await redis_db.disconnect()
-
-
-@pytest.fixture(autouse=True)
-async def create_admin_user():
-
-    await pgdb.connect()
-    query = """DELETE FROM users WHERE email = :email;"""
-    await pgdb.execute_with_transaction(
-        query,
-        parameters={
-            "email": admin_user_data["email"],
-        },
-    )
-    query = """INSERT INTO users(
-        first_name, last_name, email, hashed_password, is_admin)
-        VALUES (:first_name, :last_name, :email, :password, :is_admin);
-        """
-    await pgdb.execute_with_transaction(
-        query,
-        parameters={
-            "first_name": admin_user_data["first_name"],
-            "last_name": admin_user_data["last_name"],
-            "email": admin_user_data["email"],
-            "password": admin_user_data["hashed_password"],
-            "is_admin": True,
-        },
+# Built once, only the bound values are sent on each reset
+_reset_statements = (
+    text('TRUNCATE TABLE "users"'),
+    text(
+        """INSERT INTO users(first_name, last_name, email, hashed_password, is_admin)
+        VALUES (:first_name, :last_name, :email, :password, true)"""
+    ),
+)
+
+
+async def _reset(db, redis):
+    async with db.session() as session, session.begin():
+        await session.exec(_reset_statements[0])
+        await session.exec(
+            _reset_statements[1],
+            params={
+                "first_name": admin_user_data["first_name"],
+                "last_name": admin_user_data["last_name"],
+                "email": admin_user_data["email"],
+                "password": admin_user_data["hashed_password"],
+            },
+        )
+    await redis.flushdb()  # Clear rate limit data and cached users
+    clear_current_user_cache()  # Users were replaced behind the services' back
+
+
+async def _create_worker_schema(db, schema):
+    async with db.session() as session, session.begin():
+        await session.exec(text(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE'))
+        await session.exec(text(f'CREATE SCHEMA "{schema}"'))
+        connection = await session.connection()
+        # Without checkfirst, as the tables of the public schema are visible too
+        await connection.run_sync(metadata.create_all, checkfirst=False)
+
+
+async def _drop_worker_schema(db, schema):
+    async with db.session() as session, session.begin():
+        await session.exec(text(f'DROP SCHEMA "{schema}" CASCADE'))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def fixture_db():
+    # The fixtures keep their own connections for the whole session, the app's
+    # pgdb and redis_db are connected and closed by the client's lifespan
+    pg_settings = get_postgres_settings()
+    schema = pg_settings.POSTGRES_SCHEMA
+    db = PostgresDatabase(
+        str(pg_settings.postgres_dsn), pool_size=1, max_overflow=0, schema=schema
     )
-    await pgdb.disconnect()
+    await db.connect()
+    if _worker is not None:
+        await _create_worker_schema(db, schema)
+    redis = Redis.from_url(str(get_redis_settings().redis_dsn))
+    # Seeded now too, session-scoped fixtures log in before any test runs
+    await _reset(db, redis)
+    yield db, redis
+    await redis.aclose()
+    if _worker is not None:
+        await _drop_worker_schema(db, schema)
+    await db.disconnect()
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def reset_state(fixture_db):
+    await _reset(*fixture_db)
     yield
 
 
-# Add the middleware to override client IP during tests
-app.add_middleware(
-    TestClientIPOverrideMiddleware, client_host="1.2.3.4", client_port=12345
-)
+def pytest_collection_modifyitems(items):
+    # The application and its connections live on the session loop, so the
+    # tests calling it must run there too
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
-@pytest.fixture()
-def client():
-    with TestClient(app) as c:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(fixture_db):
+    # Started once, the reset_state fixture clears what tests leave behind.
+    # Requests are handed to the app in process, on the test's own loop, and
+    # redirects are followed as TestClient did. The application is only
+    # imported by the tests that call it.
+    from pyback.main import app
+
+    # Add the middleware to override client IP during tests
+    app.add_middleware(
+        TestClientIPOverrideMiddleware, client_host="1.2.3.4", client_port=12345
+    )
+    transport = ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        AsyncClient(
+            transport=transport, base_url="http://testserver", follow_redirects=True
+        ) as c,
+    ):
         yield c
+
+
+@pytest.fixture(scope="session")
+def admin_credentials():
+    """Admin user credentials for authentication."""
+    return {
+        "email": admin_user_data["email"],
+        "password": admin_user_data["password"],
+    }
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def admin_auth_headers(client, admin_credentials):
+    """Get authentication headers with valid JWT token for an admin user.
+
+    Logged in once for the whole suite, the token stays valid as the admin is
+    seeded again with the same email before each test.
+    """
+    # Get JWT token
+    token_response = await client.post(
+        "/auth/token",
+        json=admin_credentials,
+    )
+    assert token_response.status_code == 200
+    token = token_response.json()["access_token"]
+
+    # Verify the user is an admin
+    headers = {"Authorization": f"Bearer {token}"}
+    user_response = await client.get("/users/me", headers=headers)
+    assert user_response.status_code == 200
+    assert user_response.json()["is_admin"] == True
+
+    return headers
@@ -1,7 +1,7 @@
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_user_signup_data():
     """Valid user data for signup."""
     return {
@@ -12,33 +12,24 @@ def valid_user_signup_data():
     }
 
 
-@pytest.fixture
-def admin_credentials():
-    """Admin user credentials for authentication."""
-    return {
-        "email": "admin@example.com",
-        "password": "adminpass123",
-    }
-
-
 class TestAuthentication:
-    def test_user_signup_duplicate_email(self, client, valid_user_signup_data):
+    async def test_user_signup_duplicate_email(self, client, valid_user_signup_data):
         """Ensures duplicate email registration is prevented."""
         # Create the user for the first time
-        client.post("/auth/signup", json=valid_user_signup_data)
+        await client.post("/auth/signup", json=valid_user_signup_data)
 
         # Try to create the user again with the same email
-        response = client.post("/auth/signup", json=valid_user_signup_data)
+        response = await client.post("/auth/signup", json=valid_user_signup_data)
 
         assert response.status_code == 409
         assert "email already exists" in response.json()["detail"].lower()
 
-    def test_user_login(self, client, valid_user_signup_data):
+    async def test_user_login(self, client, valid_user_signup_data):
         """Validates successful user login process."""
-        client.post("/auth/signup", json=valid_user_signup_data)
+        await client.post("/auth/signup", json=valid_user_signup_data)
 
         # Now, try to login
-        response = client.post(
+        response = await client.post(
             "/auth/token",
             json={
                 "email": valid_user_signup_data["email"],
@@ -51,12 +42,12 @@ class TestAuthentication:
         assert "access_token" in token_data
         assert token_data["token_type"] == "bearer"
 
-    def test_protected_route(self, client, valid_user_signup_data):
+    async def test_protected_route(self, client, valid_user_signup_data):
         """Verifies access to protected routes with valid credentials."""
         # First, register user
-        client.post("/auth/signup", json=valid_user_signup_data)
+        await client.post("/auth/signup", json=valid_user_signup_data)
 
-        login_response = client.post(
+        login_response = await client.post(
             "/auth/token",
             json={
                 "email": valid_user_signup_data["email"],
@@ -67,18 +58,18 @@ class TestAuthentication:
 
         # Now, try to access a protected route
         headers = {"Authorization": f"Bearer {token}"}
-        response = client.get("/protected", headers=headers)
+        response = await client.get("/protected", headers=headers)
 
         assert response.status_code == 200
         user_info = response.json()
         assert valid_user_signup_data["first_name"] in user_info["message"]
 
-    def test_no_access_admin_route(self, client, valid_user_signup_data):
+    async def test_no_access_admin_route(self, client, valid_user_signup_data):
         """Verifies access to admin routes with valid credentials."""
         # First, register user
-        client.post("/auth/signup", json=valid_user_signup_data)
+        await client.post("/auth/signup", json=valid_user_signup_data)
 
-        login_response = client.post(
+        login_response = await client.post(
             "/auth/token",
             json={
                 "email": valid_user_signup_data["email"],
@@ -89,14 +80,14 @@ class TestAuthentication:
 
         # Now, try to access a admin route
         headers = {"Authorization": f"Bearer {token}"}
-        response = client.get("/admin", headers=headers)
+        response = await client.get("/admin", headers=headers)
 
         assert response.status_code == 403
         assert "permission denied" in response.json()["detail"].lower()
 
-    def test_access_admin_route(self, client, admin_credentials):
+    async def test_access_admin_route(self, client, admin_credentials):
         """Verifies access to admin routes with valid credentials."""
-        login_response = client.post(
+        login_response = await client.post(
             "/auth/token",
             json=admin_credentials,
         )
@@ -104,7 +95,7 @@ class TestAuthentication:
 
         # Now, try to access a admin route
         headers = {"Authorization": f"Bearer {token}"}
-        response = client.get("/admin", headers=headers)
+        response = await client.get("/admin", headers=headers)
 
         assert response.status_code == 200
         assert "protected admin route" in response.json()["message"].lower()
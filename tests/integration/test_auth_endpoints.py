@@ -1,7 +1,23 @@
 import pytest
 
-
-@pytest.fixture
+# Inputs over a length limit, built once and given short ids when parametrized
+LONG_TOKEN = "Bearer " + "a" * 1000
+LONG_EMAIL = "a" * 256 + "@toolong.com"
+LONG_PASSWORD = "a" * 129
+LONG_NAME = "a" * 256
+
+# Checked in a loop, a request each. Signup inputs stay parametrized instead, as
+# signups are limited to 3 per client and the limits are only reset per test.
+INVALID_TOKENS = (
+    "",  # Empty token
+    "not_a_bearer_token",  # Missing Bearer prefix
+    "Bearer ",  # Empty token with Bearer prefix
+    "Bearer invalid.token.format",  # Invalid JWT format
+    LONG_TOKEN,  # Too long token
+)
+
+
+@pytest.fixture(scope="module")
 def valid_user_signup_data():
     """Valid user data for signup."""
     return {
@@ -12,7 +28,17 @@ def valid_user_signup_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def make_signup(valid_user_signup_data):
+    """Build signup data from the valid one, with some fields replaced."""
+
+    def _make_signup(**overrides):
+        return {**valid_user_signup_data, **overrides}
+
+    return _make_signup
+
+
+@pytest.fixture(scope="module")
 def invalid_credentials():
     """Invalid user credentials for authentication."""
     return {
@@ -32,18 +58,15 @@ class TestAuthentication:
             "multiple@@at.com",
             ".startwithdot@domain.com",
             "endwithdot.@domain.com",
-            "",
-            "a" * 256 + "@toolong.com",  # Test email length limit
+            pytest.param("", id="empty"),
+            pytest.param(LONG_EMAIL, id="long-email"),  # Test email length limit
         ],
     )
-    def test_user_signup_invalid_email(
-        self, client, valid_user_signup_data, invalid_email
-    ):
+    async def test_user_signup_invalid_email(self, client, make_signup, invalid_email):
         """Validates email format rejection during signup."""
-        invalid_data = valid_user_signup_data.copy()
-        invalid_data["email"] = invalid_email
+        invalid_data = make_signup(email=invalid_email)
 
-        response = client.post("/auth/signup", json=invalid_data)
+        response = await client.post("/auth/signup", json=invalid_data)
 
         assert response.status_code == 422
         response_fields = [d["loc"][-1] for d in response.json()["detail"]]
@@ -54,19 +77,19 @@ class TestAuthentication:
         [
             "",  # Empty password
             "short",  # Too short
-            "a" * 129,  # Too long (assuming reasonable max length)
+            LONG_PASSWORD,  # Too long
             " " * 10,  # Only spaces
             "\t\n\r",  # Only whitespace
         ],
+        ids=["empty", "short", "long-password", "spaces", "whitespace"],
     )
-    def test_user_signup_invalid_password(
-        self, client, valid_user_signup_data, invalid_password
+    async def test_user_signup_invalid_password(
+        self, client, make_signup, invalid_password
     ):
         """Ensures invalid password formats are blocked during signup."""
-        invalid_data = valid_user_signup_data.copy()
-        invalid_data["password"] = invalid_password
+        invalid_data = make_signup(password=invalid_password)
 
-        response = client.post("/auth/signup", json=invalid_data)
+        response = await client.post("/auth/signup", json=invalid_data)
 
         assert response.status_code == 422
         response_fields = [d["loc"][-1] for d in response.json()["detail"]]
@@ -76,29 +99,36 @@ class TestAuthentication:
         "field,invalid_value",
         [
             ("first_name", ""),  # Empty first name
-            ("first_name", "a" * 256),  # Too long first name
+            ("first_name", LONG_NAME),  # Too long first name
             ("first_name", " "),  # Only space
             ("last_name", ""),  # Empty last name
-            ("last_name", "a" * 256),  # Too long last name
+            ("last_name", LONG_NAME),  # Too long last name
             ("last_name", " "),  # Only space
         ],
+        ids=[
+            "first_name-empty",
+            "first_name-long",
+            "first_name-space",
+            "last_name-empty",
+            "last_name-long",
+            "last_name-space",
+        ],
     )
-    def test_user_signup_invalid_names(
-        self, client, valid_user_signup_data, field, invalid_value
+    async def test_user_signup_invalid_names(
+        self, client, make_signup, field, invalid_value
     ):
         """Checks name validation during user signup."""
-        invalid_data = valid_user_signup_data.copy()
-        invalid_data[field] = invalid_value
+        invalid_data = make_signup(**{field: invalid_value})
 
-        response = client.post("/auth/signup", json=invalid_data)
+        response = await client.post("/auth/signup", json=invalid_data)
 
         assert response.status_code == 422
         response_fields = [d["loc"][-1] for d in response.json()["detail"]]
         assert field in response_fields
 
-    def test_user_signup_success(self, client, valid_user_signup_data):
+    async def test_user_signup_success(self, client, valid_user_signup_data):
         """Verifies successful user registration process."""
-        response = client.post("/auth/signup", json=valid_user_signup_data)
+        response = await client.post("/auth/signup", json=valid_user_signup_data)
         assert response.status_code == 201
         created_user = response.json()
 
@@ -109,27 +139,29 @@ class TestAuthentication:
         assert "password" not in created_user
         assert "password_hashed" not in created_user
 
-    def test_user_signup_malformed_json(self, client):
+    async def test_user_signup_malformed_json(self, client):
         """Validates rejection of malformed JSON during signup."""
-        response = client.post(
+        response = await client.post(
             "/auth/signup",
             data="not a json",
             headers={"Content-Type": "application/json"},
         )
         assert response.status_code == 422
 
-    def test_user_signup_wrong_content_type(self, client, valid_user_signup_data):
+    async def test_user_signup_wrong_content_type(self, client, valid_user_signup_data):
         """Ensures incorrect content type is rejected during signup."""
-        response = client.post(
+        response = await client.post(
             "/auth/signup",
             data=str(valid_user_signup_data),
             headers={"Content-Type": "text/plain"},
         )
         assert response.status_code == 422
 
-    def test_user_login_with_invalid_credentials(self, client, invalid_credentials):
+    async def test_user_login_with_invalid_credentials(
+        self, client, invalid_credentials
+    ):
         """Validates login failure with incorrect credentials."""
-        response = client.post("/auth/token", json=invalid_credentials)
+        response = await client.post("/auth/token", json=invalid_credentials)
 
         assert response.status_code == 401
         assert "could not validate credentials" in response.json()["detail"].lower()
@@ -137,57 +169,27 @@ class TestAuthentication:
     @pytest.mark.parametrize(
         "missing_field", ["email", "password", "first_name", "last_name"]
     )
-    def test_user_signup_missing_required_fields(
+    async def test_user_signup_missing_required_fields(
         self, client, valid_user_signup_data, missing_field
     ):
         """Checks signup rejection when required fields are missing."""
         invalid_data = valid_user_signup_data.copy()
         del invalid_data[missing_field]
 
-        response = client.post("/auth/signup", json=invalid_data)
+        response = await client.post("/auth/signup", json=invalid_data)
 
         assert response.status_code == 422
 
-    @pytest.mark.parametrize(
-        "invalid_token",
-        [
-            "",  # Empty token
-            "not_a_bearer_token",  # Missing Bearer prefix
-            "Bearer ",  # Empty token with Bearer prefix
-            "Bearer invalid.token.format",  # Invalid JWT format
-            "Bearer " + "a" * 1000,  # Too long token
-        ],
-    )
-    def test_protected_route_invalid_token_formats(self, client, invalid_token):
-        """Checks token validation for protected routes."""
-        headers = {"Authorization": invalid_token}
-        response = client.get("/protected", headers=headers)
-
-        assert response.status_code == 401
-        response_msg = response.json()["detail"].lower()
-        assert (
-            "missing authentication token" in response_msg
-            or "not authenticated" in response_msg
-        )
-
-    @pytest.mark.parametrize(
-        "invalid_token",
-        [
-            "",  # Empty token
-            "not_a_bearer_token",  # Missing Bearer prefix
-            "Bearer ",  # Empty token with Bearer prefix
-            "Bearer invalid.token.format",  # Invalid JWT format
-            "Bearer " + "a" * 1000,  # Too long token
-        ],
-    )
-    def test_admin_route_invalid_token_formats(self, client, invalid_token):
-        """Checks token validation for admin routses."""
-        headers = {"Authorization": invalid_token}
-        response = client.get("/admin", headers=headers)
-
-        assert response.status_code == 401
-        response_msg = response.json()["detail"].lower()
-        assert (
-            "missing authentication token" in response_msg
-            or "not authenticated" in response_msg
-        )
+    @pytest.mark.parametrize("route", ["/protected", "/admin"])
+    async def test_invalid_token_formats(self, client, route):
+        """Checks token validation for protected and admin routes."""
+        for invalid_token in INVALID_TOKENS:
+            headers = {"Authorization": invalid_token}
+            response = await client.get(route, headers=headers)
+
+            assert response.status_code == 401, invalid_token
+            response_msg = response.json()["detail"].lower()
+            assert (
+                "missing authentication token" in response_msg
+                or "not authenticated" in response_msg
+            ), invalid_token
@@ -1,6 +1,23 @@
 class TestApi:
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test health check endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
+
+    async def test_process_time_header(self, client):
+        """Test that responses report their processing time."""
+        response = await client.get("/health")
+        assert float(response.headers["X-Process-Time"]) >= 0
+
+    async def test_process_time_header_on_preflight(self, client):
+        """Test that CORS preflights answered by the CORS middleware are timed."""
+        response = await client.options(
+            "/health",
+            headers={
+                "Origin": "http://localhost",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+        assert response.status_code == 200
+        assert "X-Process-Time" in response.headers
@@ -1,15 +1,14 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class TestClientIPOverrideMiddleware(BaseHTTPMiddleware):
+class TestClientIPOverrideMiddleware:
     def __init__(self, app: ASGIApp, client_host: str, client_port: int = 12345):
-        super().__init__(app)
+        self.app = app
         self.client_host = client_host
         self.client_port = client_port
 
-    async def dispatch(self, request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Override the client IP address in the ASGI scope."""
-
-        request.scope["client"] = (self.client_host, self.client_port)
-        return await call_next(request)
+        if scope["type"] == "http":
+            scope["client"] = (self.client_host, self.client_port)
+        await self.app(scope, receive, send)
@@ -0,0 +1,15 @@
+import pytest
+from pydantic_core import SchemaSerializer, SchemaValidator
+from pyback.api.models.auth import LoginRequest, Token, TokenData
+from pyback.api.models.user import User, UserCreate, UserUpdate
+
+
+class TestModels:
+    @pytest.mark.parametrize(
+        "model", [LoginRequest, Token, TokenData, User, UserCreate, UserUpdate]
+    )
+    def test_validators_built_at_import(self, model):
+        """Request and response models must not defer building their validators"""
+        assert model.__pydantic_complete__
+        assert isinstance(model.__pydantic_validator__, SchemaValidator)
+        assert isinstance(model.__pydantic_serializer__, SchemaSerializer)
@@ -0,0 +1,58 @@
+from datetime import timedelta
+import time
+
+import jwt
+import pytest
+from pyback.api.dependencies.common import get_auth_settings
+from pyback.core.auth import create_access_token, decode_access_token
+
+
+@pytest.fixture()
+def secret():
+    return get_auth_settings().JWT_SECRET.get_secret_value()
+
+
+class TestAccessToken:
+    def test_round_trip(self, secret):
+        """Test that a created token decodes back to its claims"""
+        token = create_access_token({"sub": "user@example.com"})
+        payload = decode_access_token(token, secret, ("HS256",))
+        assert payload["sub"] == "user@example.com"
+
+    def test_expired(self, secret):
+        """Test that an expired token is rejected as expired"""
+        token = create_access_token(
+            {"sub": "user@example.com"}, expires_delta=timedelta(seconds=-1)
+        )
+        with pytest.raises(jwt.ExpiredSignatureError):
+            decode_access_token(token, secret, ("HS256",))
+
+    def test_wrong_key(self):
+        """Test that a token signed with another key is rejected"""
+        token = create_access_token({"sub": "user@example.com"})
+        with pytest.raises(jwt.InvalidSignatureError):
+            decode_access_token(token, "anotherkey", ("HS256",))
+
+    def test_non_integer_exp(self, secret):
+        """Test that an exp claim that is not an integer is rejected"""
+        token = jwt.encode({"sub": "user@example.com", "exp": "soon"}, secret)
+        with pytest.raises(jwt.DecodeError):
+            decode_access_token(token, secret, ("HS256",))
+
+    def test_float_exp(self, secret):
+        """Test that a float exp claim is accepted, as jwt.decode does"""
+        token = jwt.encode({"sub": "user@example.com", "exp": time.time() + 60}, secret)
+        payload = decode_access_token(token, secret, ("HS256",))
+        assert payload["sub"] == "user@example.com"
+
+    def test_not_yet_valid(self, secret):
+        """Test that a token whose nbf claim is in the future is rejected"""
+        token = jwt.encode({"sub": "user@example.com", "nbf": time.time() + 60}, secret)
+        with pytest.raises(jwt.ImmatureSignatureError):
+            decode_access_token(token, secret, ("HS256",))
+
+    def test_audience(self, secret):
+        """Test that a token meant for an audience is rejected"""
+        token = jwt.encode({"sub": "user@example.com", "aud": "other"}, secret)
+        with pytest.raises(jwt.InvalidAudienceError):
+            decode_access_token(token, secret, ("HS256",))
@@ -0,0 +1,18 @@
+import time
+
+from pyback.core.utils import uuid7
+
+
+class TestUuid7:
+    def test_version_and_variant(self):
+        """Test that uuid7 sets the RFC 9562 version and variant bits"""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_time_ordered(self):
+        """Test that IDs from different milliseconds sort by creation time"""
+        first = uuid7()
+        time.sleep(0.002)
+        assert uuid7() > first
+        assert first.int >> 80 <= time.time_ns() // 1_000_000